@@ -1,8 +1,16 @@
 import os
+import asyncio
 import httpx
 import logging
+import orjson
+import random
+import re
+import time
 import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from typing import Optional, List, Dict
+from urllib.parse import unquote
 from mcp.server.fastmcp import FastMCP
 
 # ---------------- CONFIG ----------------
@@ -11,80 +19,518 @@ from mcp.server.fastmcp import FastMCP
 TALLY_API_KEY = os.getenv("TALLY_API_KEY")
 TALLY_API_BASE = "https://api.tally.so"
 
-if not TALLY_API_KEY:
-    raise ValueError("Set TALLY_API_KEY environment variable or inline key")
-
-# Headers for all API requests
-HEADERS = {"Authorization": f"Bearer {TALLY_API_KEY}", "Content-Type": "application/json"}
+# Connection pool tuning. api.tally.so is a single host, so the keep-alive
+# settings decide whether bursts of tool calls reuse warm connections.
+TALLY_HTTPX_MAX_CONNECTIONS = int(os.getenv("TALLY_HTTPX_MAX_CONNECTIONS", "100"))
+TALLY_HTTPX_MAX_KEEPALIVE = int(os.getenv("TALLY_HTTPX_MAX_KEEPALIVE", "50"))
+TALLY_HTTPX_KEEPALIVE_EXPIRY = float(os.getenv("TALLY_HTTPX_KEEPALIVE_EXPIRY", "60.0"))
+
+# Timeouts. Connecting fails fast so a dead peer is retried quickly; the
+# read timeout (TALLY_TIMEOUT) bounds how long a slow response may take.
+TALLY_CONNECT_TIMEOUT = 3.0
+TALLY_TIMEOUT = float(os.getenv("TALLY_TIMEOUT", "20.0"))
+TALLY_WRITE_TIMEOUT = 10.0
+TALLY_POOL_TIMEOUT = 5.0
+
+# Upper bound on Tally requests in flight at once, across all tools. Extra
+# requests queue instead of opening new connections and tripping rate limits.
+TALLY_MAX_CONCURRENCY = int(os.getenv("TALLY_MAX_CONCURRENCY", "16"))
+
+# Largest page range a single page-range tool call may fetch
+MAX_PAGES_PER_RANGE = 50
+
+# Largest number of forms TALLY_LIST_FORMS_DETAILED fetches details for
+MAX_DETAILED_FORMS = 100
+
+# Largest number of calls a single TALLY_BATCH request may contain
+MAX_BATCH_CALLS = 50
+
+# Largest number of submissions TALLY_GET_SUBMISSIONS_BULK fetches per call
+MAX_BULK_SUBMISSIONS = 100
+
+# Retry policy. Rate-limited (429) requests are always retried; gateway
+# errors and network failures are only retried for idempotent methods so a
+# POST is never sent twice.
+TALLY_MAX_RETRIES = int(os.getenv("TALLY_MAX_RETRIES", "4"))
+RETRY_BACKOFF_BASE = 0.5
+RETRY_BACKOFF_MAX = 30.0
+RETRYABLE_STATUS_CODES = {502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+# Read-only tools cache successful responses for a short time so an agent
+# exploring a form does not re-fetch the same resource on every step.
+# Set TALLY_CACHE_TTL=0 to disable.
+TALLY_CACHE_TTL = float(os.getenv("TALLY_CACHE_TTL", "30"))
+CACHE_MAX_ENTRIES = 1024
+
+# Webhook event pages get new events as forms are submitted, so they are
+# cached for a shorter time than other read-only responses.
+WEBHOOK_EVENTS_CACHE_TTL = min(TALLY_CACHE_TTL, 15.0)
+
+# Headers for all API requests, set once on the shared client
+HEADERS = {
+    "Authorization": f"Bearer {TALLY_API_KEY}",
+    "Accept": "application/json",
+    "Content-Type": "application/json",
+}
 
 # ---------------- LOGGING ----------------
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+# Handlers are configured by whoever runs the server (see __main__ below),
+# so importing this module does not change the host's logging setup.
+logger = logging.getLogger("tally_mcp")
+
+# ---------------- HTTP CLIENT ----------------
+# One AsyncClient is shared by every tool so connections to api.tally.so are
+# kept alive between calls instead of paying a TCP + TLS handshake each time.
+# HTTP/2 lets concurrent tool calls multiplex over a single connection.
+_client: Optional[httpx.AsyncClient] = None
+_active_sessions = 0
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Return the shared HTTP client, creating it on first use.
+
+    The client is created lazily so that it is bound to the event loop
+    that FastMCP is running, not to whatever loop existed at import time.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=TALLY_API_BASE,
+            headers=HEADERS,
+            http2=True,
+            timeout=httpx.Timeout(
+                connect=TALLY_CONNECT_TIMEOUT,
+                read=TALLY_TIMEOUT,
+                write=TALLY_WRITE_TIMEOUT,
+                pool=TALLY_POOL_TIMEOUT,
+            ),
+            limits=httpx.Limits(
+                max_connections=TALLY_HTTPX_MAX_CONNECTIONS,
+                max_keepalive_connections=TALLY_HTTPX_MAX_KEEPALIVE,
+                keepalive_expiry=TALLY_HTTPX_KEEPALIVE_EXPIRY,
+            ),
+        )
+    return _client
+
+
+async def close_client():
+    """Close the shared HTTP client and release its pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def warm_up():
+    """
+    Open a pooled connection to api.tally.so before the first tool call.
+
+    Fetching the user info resolves DNS and completes the TLS handshake in
+    the background, and primes the remembered user for TALLY_GET_USER_INFO.
+    """
+    result = await fetch_user_info()
+    if is_error(result):
+        logger.warning("Tally warm-up request failed: %s", result.get("error", result["status"]))
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """
+    Warm up the shared HTTP client on start and close it when the last MCP session ends.
+
+    FastMCP enters the lifespan once per session on HTTP transports, so
+    sessions are counted to avoid closing the client under a live session.
+    """
+    global _active_sessions
+    _active_sessions += 1
+    warm_up_task = asyncio.create_task(warm_up()) if _active_sessions == 1 else None
+    try:
+        yield
+    finally:
+        if warm_up_task is not None:
+            warm_up_task.cancel()
+        _active_sessions -= 1
+        if _active_sessions == 0:
+            await close_client()
+
+# ---------------- RETRY / RATE LIMIT ----------------
+# After a 429 every request waits until this monotonic timestamp, so
+# concurrent tool calls back off together instead of hammering the API.
+_rate_limited_until = 0.0
+_request_slots = asyncio.Semaphore(TALLY_MAX_CONCURRENCY)
+
+
+def retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    """
+    Seconds to wait before the next attempt.
+
+    Honors a numeric Retry-After header when the server sends one, otherwise
+    uses exponential backoff with jitter. Capped at RETRY_BACKOFF_MAX.
+    """
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(max(float(retry_after), 0.0), RETRY_BACKOFF_MAX)
+            except ValueError:
+                pass
+    delay = RETRY_BACKOFF_BASE * (2 ** attempt) + random.uniform(0, RETRY_BACKOFF_BASE)
+    return min(delay, RETRY_BACKOFF_MAX)
+
+
+async def send_with_retry(method: str, url: str, **kwargs) -> httpx.Response:
+    """
+    Send a request on the shared client, retrying rate limits and transient failures.
+
+    Each attempt holds one of the TALLY_MAX_CONCURRENCY request slots; the
+    slot is released while waiting to retry.
+    Returns the final response, or raises the last httpx.RequestError if the
+    request could not be sent at all.
+    """
+    global _rate_limited_until
+    retry_transient = method.upper() in IDEMPOTENT_METHODS
+
+    for attempt in range(TALLY_MAX_RETRIES + 1):
+        wait = _rate_limited_until - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        last_attempt = attempt == TALLY_MAX_RETRIES
+        try:
+            async with _request_slots:
+                r = await get_client().request(method, url, **kwargs)
+        except httpx.RequestError as e:
+            if not retry_transient or last_attempt:
+                raise
+            delay = retry_delay(attempt)
+            logger.warning("%s %s failed (%s), retrying in %.1fs", method, url, e, delay)
+            await asyncio.sleep(delay)
+            continue
+
+        rate_limited = r.status_code == 429
+        transient = retry_transient and r.status_code in RETRYABLE_STATUS_CODES
+        if last_attempt or not (rate_limited or transient):
+            return r
+
+        delay = retry_delay(attempt, r)
+        if rate_limited:
+            _rate_limited_until = max(_rate_limited_until, time.monotonic() + delay)
+        logger.warning("%s %s returned %s, retrying in %.1fs", method, url, r.status_code, delay)
+        await asyncio.sleep(delay)
+
+# ---------------- RESPONSE CACHE ----------------
+# (url, sorted params) -> (expires_at, response, etag), kept in LRU order.
+# Expired entries stay until they are evicted or invalidated: one with an
+# ETag makes the next GET a conditional request that Tally answers with an
+# empty 304, and any of them can stand in for a fresh response while Tally
+# is unreachable.
+_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+# Failures that fall back to an expired cached response, if there is one.
+# 500 also covers requests that could not be sent at all.
+STALE_FALLBACK_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# (url, sorted params) -> task for a GET that is currently on the wire, so
+# concurrent identical GETs share one upstream request.
+_inflight: Dict[tuple, asyncio.Task] = {}
+
+
+def cache_key(url: str, params: dict = None) -> tuple:
+    """Build the cache key for a GET request."""
+    return (url, tuple(sorted((params or {}).items())))
+
+
+def cache_get(key: tuple):
+    """Return a cached response if it has not expired, otherwise None."""
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+    expires_at, value, etag = entry
+    if expires_at <= time.monotonic():
+        return None
+    _cache.move_to_end(key)
+    return value
+
+
+def cache_put(key: tuple, value, ttl: float, etag: str = None):
+    """Store a response, evicting the least recently used entry when full."""
+    _cache[key] = (time.monotonic() + ttl, value, etag)
+    _cache.move_to_end(key)
+    while len(_cache) > CACHE_MAX_ENTRIES:
+        _cache.popitem(last=False)
+
+
+def invalidate_cache(collection: str, resource_id: str = None):
+    """
+    Drop cached responses after a write.
+
+    Clears every cached listing of the collection (e.g. "/forms", any query
+    params) and, when resource_id is given, the resource and everything
+    below it (e.g. "/forms/abc" and "/forms/abc/questions").
+    """
+    resource = f"{collection}/{resource_id}" if resource_id is not None else None
+    stale = [
+        k for k in _cache
+        if k[0] == collection
+        or (resource is not None and (k[0] == resource or k[0].startswith(resource + "/")))
+    ]
+    for key in stale:
+        del _cache[key]
 
 # ---------------- MCP SERVER ----------------
-mcp = FastMCP("tally-mcp")
+mcp = FastMCP("tally-mcp", lifespan=lifespan)
 
 
 # ---------------- HTTP HELPER ----------------
-async def safe_request(method: str, url: str, params: dict = None, json: dict = None):
+SUCCESS_STATUS_CODES = frozenset({200, 201})
+
+# Prebuilt results for responses that carry no useful body. The same dict
+# is returned to every caller, so treat them as read-only. They stay plain
+# dicts (not MappingProxyType) so FastMCP serializes them as JSON.
+NO_CONTENT_RESPONSE = {"status": 204, "message": "Success (no content)"}
+
+STATUS_ERRORS = {
+    401: {"status": 401, "error": "Unauthorized - check API key"},
+    403: {"status": 403, "error": "Forbidden - insufficient permissions"},
+    404: {"status": 404, "error": "Not found"},
+}
+
+# Returned by every tool when the server was started without an API key.
+# The key is checked per request rather than at import so the module can
+# be imported (and its tools listed) before Tally is configured.
+MISSING_API_KEY_ERROR = {"status": 500, "error": "TALLY_API_KEY not set"}
+
+
+async def safe_request(method: str, url: str, params: dict = None, json: dict = None, cache_ttl: float = 0):
     """
     Wrapper for all HTTP requests with consistent error handling.
     
     IMPORTANT NOTES FOR DEVELOPERS:
     1. Always use this function for API calls - don't make direct HTTP requests
-    2. This function handles authentication, timeouts, and error responses
+    2. This function handles authentication, timeouts, retries, and error responses
     3. Returns parsed JSON on success, error dict on failure
-    4. Timeout is set to 30 seconds - adjust if needed for large requests
+    4. Connecting times out after 3 seconds and reading after TALLY_TIMEOUT
+       (20 seconds by default) - raise it if large requests time out
+    5. Requests go through the shared client from get_client(), so
+       connections are reused across tool calls
+    6. 429 responses are retried after Retry-After; 502/503/504 and network
+       errors are retried with backoff for idempotent methods only
+    7. GET requests with cache_ttl > 0 are served from the response cache;
+       write tools must call invalidate_cache() for the resources they change
+       (expired entries with an ETag are revalidated with If-None-Match)
+    8. Concurrent identical GETs share a single in-flight request
     
     Args:
         method: HTTP method (GET, POST, PATCH, DELETE)
-        url: Full API endpoint URL
+        url: API path relative to TALLY_API_BASE, e.g. "/forms"
         params: Query parameters (for GET requests)
         json: Request body (for POST/PATCH requests)
+        cache_ttl: Seconds to cache a successful GET response (0 disables)
     
     Returns:
         dict: API response or error information
     """
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            r = await client.request(method, url, headers=HEADERS, params=params, json=json)
-
-            if r.status_code in (200, 201):
-                return r.json()
-            if r.status_code == 204:
-                return {"status": 204, "message": "Success (no content)"}
-            if r.status_code == 401:
-                return {"status": 401, "error": "Unauthorized - check API key"}
-            if r.status_code == 403:
-                return {"status": 403, "error": "Forbidden - insufficient permissions"}
-            if r.status_code == 404:
-                return {"status": 404, "error": "Not found"}
-            if r.status_code == 400:
-                return {"status": 400, "error": "Bad request", "response": r.json()}
-
-            # fallback
-            try:
-                return {"status": r.status_code, "response": r.json()}
-            except Exception:
-                return {"status": r.status_code, "response": r.text}
+    if not TALLY_API_KEY:
+        return MISSING_API_KEY_ERROR
+    if method != "GET":
+        return await _request(method, url, params=params, json=json)
+
+    key = cache_key(url, params)
+    if cache_ttl > 0:
+        cached = cache_get(key)
+        if cached is not None:
+            return cached
+
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_get(key, url, params, cache_ttl))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shield the shared request so one caller being cancelled does not
+    # cancel it for everyone else waiting on the same key.
+    return await asyncio.shield(task)
+
+
+async def _request(method: str, url: str, params: dict = None, json: dict = None):
+    """Send a request and map the response to the dict returned by safe_request."""
+    # orjson is much faster than the stdlib json module httpx uses; the
+    # Content-Type header is already set on the shared client.
+    content = orjson.dumps(json) if json is not None else None
+    try:
+        r = await send_with_retry(method, url, params=params, content=content)
+    except httpx.RequestError as e:
+        return request_failed(e)
+
+    logger.debug("%s %s -> %s (%s)", method, url, r.status_code, r.http_version)
+    return handle_response(r)
+
+
+async def _get(key: tuple, url: str, params: dict, cache_ttl: float):
+    """
+    Send a GET and cache a successful result for cache_ttl seconds.
 
-        except httpx.RequestError as e:
-            logging.error(f"HTTP Request failed: {e}")
-            return {"status": 500, "error": str(e)}
+    If an expired cache entry has an ETag, it is sent as If-None-Match and a
+    304 Not Modified reuses the cached result instead of downloading it again.
+    If Tally is down or rate limiting, an expired entry is returned instead of
+    the error, marked with "_stale": True and its age in "_age_seconds".
+    """
+    entry = _cache.get(key) if cache_ttl > 0 else None
+    etag = entry[2] if entry is not None else None
+    headers = {"If-None-Match": etag} if etag else None
+    try:
+        r = await send_with_retry("GET", url, params=params, headers=headers)
+    except httpx.RequestError as e:
+        error = request_failed(e)
+        return stale_result(entry, cache_ttl) if entry is not None else error
+
+    logger.debug("GET %s -> %s (%s)", url, r.status_code, r.http_version)
+    if r.status_code == 304 and entry is not None:
+        result = entry[1]
+    else:
+        result = handle_response(r)
+        if entry is not None and r.status_code in STALE_FALLBACK_STATUS_CODES:
+            return stale_result(entry, cache_ttl)
+    if is_error(result):
+        # e.g. a 404: the expired copy must not be served as a fallback later
+        _cache.pop(key, None)
+    elif cache_ttl > 0:
+        cache_put(key, result, cache_ttl, r.headers.get("ETag", etag))
+    return result
+
+
+def stale_result(entry: tuple, cache_ttl: float):
+    """Mark an expired cache entry's response as stale for returning to a tool."""
+    expires_at, value, _ = entry
+    if not isinstance(value, dict):
+        return value
+    age = time.monotonic() - (expires_at - cache_ttl)
+    return {**value, "_stale": True, "_age_seconds": round(age, 1)}
+
+
+def request_failed(e: httpx.RequestError) -> dict:
+    """Log a request that could not be sent and build its error result."""
+    logger.error("HTTP Request failed: %s", e)
+    return {"status": 500, "error": str(e)}
+
+
+def handle_response(r: httpx.Response):
+    """Map an API response to the parsed body or the error dict returned by safe_request."""
+    status = r.status_code
+    if status == 204:
+        return NO_CONTENT_RESPONSE
+    error = STATUS_ERRORS.get(status)
+    if error is not None:
+        return error
+
+    body = _response_body(r)
+    if status in SUCCESS_STATUS_CODES:
+        return body
+    if status == 400:
+        return {"status": 400, "error": "Bad request", "response": body}
+    # fallback
+    return {"status": status, "response": body}
+
+
+def _response_body(r: httpx.Response):
+    """Decode the body as JSON once, falling back to the raw text if it is not JSON."""
+    try:
+        return orjson.loads(r.content)
+    except orjson.JSONDecodeError:
+        return r.text
+
+
+def _filter_none(d: dict) -> dict:
+    """Remove None values from a params/payload dict, but keep False, 0 and empty values."""
+    return {k: v for k, v in d.items() if v is not None}
+
+
+def is_error(result) -> bool:
+    """Return True if a safe_request result describes a failed request."""
+    return (
+        isinstance(result, dict)
+        and isinstance(result.get("status"), int)
+        and result["status"] >= 400
+    )
+
+
+async def gather_pages(url: str, start_page: int, end_page: int, params: dict = None) -> List[dict]:
+    """
+    Fetch a range of pages from a paginated endpoint concurrently.
+
+    Every page request goes through safe_request on the shared client, so the
+    requests are multiplexed over the pooled HTTP/2 connection and share the
+    TALLY_MAX_CONCURRENCY limit with all other tool calls.
+
+    Args:
+        url: API path relative to TALLY_API_BASE
+        start_page: First page to fetch (inclusive)
+        end_page: Last page to fetch (inclusive)
+        params: Query parameters shared by every page request
+
+    Returns:
+        list: One safe_request result per page, in page order
+    """
+    base_params = params or {}
+    return await asyncio.gather(*(
+        safe_request("GET", url, params={**base_params, "page": page})
+        for page in range(start_page, end_page + 1)
+    ))
+
+
+def check_page_range(start_page: int, end_page: int) -> Optional[dict]:
+    """Return an error dict if a page range is invalid, otherwise None."""
+    if start_page < 1 or end_page < start_page:
+        return {"status": 400, "error": "startPage must be >= 1 and endPage must be >= startPage"}
+    if end_page - start_page + 1 > MAX_PAGES_PER_RANGE:
+        return {"status": 400, "error": f"A range can span at most {MAX_PAGES_PER_RANGE} pages"}
+    return None
+
+
+def check_id(name: str, value: str) -> Optional[dict]:
+    """Return an error dict if an ID is empty or would change the request path, otherwise None."""
+    if not value or "/" in value or value in (".", ".."):
+        return {"status": 400, "error": f"{name} must be a non-empty ID without '/'"}
+    return None
 
 # ------------------------------------------------
 #            User Info
 # ------------------------------------------------
+# The authenticated user only depends on TALLY_API_KEY, which is fixed for
+# the life of the process, so it is fetched once and served from memory.
+_user_info: Optional[dict] = None
+_user_info_lock = asyncio.Lock()
+
+
+async def fetch_user_info(force_refresh: bool = False):
+    """Return the authenticated user, fetching /users/me only when not yet known."""
+    global _user_info
+    if _user_info is not None and not force_refresh:
+        return _user_info
+    async with _user_info_lock:
+        # Another caller may have fetched it while we waited for the lock
+        if _user_info is None or force_refresh:
+            result = await safe_request("GET", "/users/me")
+            if is_error(result):
+                return result
+            _user_info = result
+    return _user_info
+
+
 @mcp.tool()
-async def TALLY_GET_USER_INFO():
+async def TALLY_GET_USER_INFO(forceRefresh: bool = False):
     """
     Retrieve details about the authenticated Tally user.
 
     This tool fetches information about the currently authenticated 
     Tally account (the user linked with your API credentials). 
     Useful for verifying account identity, email, and permissions.
+    The result is fetched once and then served from memory.
 
     Args:
-        None
+        forceRefresh (bool, optional): Re-fetch the user from Tally instead of
+            returning the remembered result. Defaults to False.
 
     Returns:
         dict: User information including:
@@ -95,7 +541,7 @@ async def TALLY_GET_USER_INFO():
             - createdAt (str): Account creation timestamp.
             - other metadata depending on the API.
     """
-    return await safe_request("GET", f"{TALLY_API_BASE}/users/me")
+    return await fetch_user_info(force_refresh=forceRefresh)
 
 # ------------------------------------------------
 #            Workspaces
@@ -122,7 +568,7 @@ async def TALLY_GET_WORKSPACE(workspaceId: str):
             - members (list): List of users with access to the workspace.
             - other metadata depending on the API.
     """
-    return await safe_request("GET", f"{TALLY_API_BASE}/workspaces/{workspaceId}")
+    return await safe_request("GET", f"/workspaces/{workspaceId}", cache_ttl=TALLY_CACHE_TTL)
 
 @mcp.tool()
 async def TALLY_LIST_WORKSPACES(page: int = 1):
@@ -149,7 +595,7 @@ async def TALLY_LIST_WORKSPACES(page: int = 1):
             - pagination (dict): Information about current page, total items, 
                                  and next/previous pages if available.
     """
-    return await safe_request("GET", f"{TALLY_API_BASE}/workspaces", params={"page": page})
+    return await safe_request("GET", "/workspaces", params={"page": page}, cache_ttl=TALLY_CACHE_TTL)
 
 @mcp.tool()
 async def TALLY_UPDATE_WORKSPACE(workspaceId: str, name: str):
@@ -179,7 +625,9 @@ async def TALLY_UPDATE_WORKSPACE(workspaceId: str, name: str):
         403 Forbidden: If the user does not have permission to update the workspace.
         404 Not Found: If the workspace does not exist.
     """
-    return await safe_request("PATCH", f"{TALLY_API_BASE}/workspaces/{workspaceId}", json={"name": name})
+    result = await safe_request("PATCH", f"/workspaces/{workspaceId}", json={"name": name})
+    invalidate_cache("/workspaces", workspaceId)
+    return result
 
 # ------------------------------------------------
 #            Forms
@@ -215,10 +663,49 @@ async def TALLY_LIST_FORMS(page: int = 1, limit: int = 50, workspaceId: str = No
         403 Forbidden: If the user does not have access to the workspace.
         404 Not Found: If no forms are found for the given parameters.
     """
-    params = {"page": page, "limit": min(limit, 500)}
-    if workspaceId:
-        params["workspaceIds"] = workspaceId
-    return await safe_request("GET", f"{TALLY_API_BASE}/forms", params=params)
+    params = _filter_none({"page": page, "limit": min(limit, 500), "workspaceIds": workspaceId})
+    return await safe_request("GET", "/forms", params=params, cache_ttl=TALLY_CACHE_TTL)
+
+@mcp.tool()
+async def TALLY_LIST_FORMS_DETAILED(page: int = 1, limit: int = 20, workspaceId: str = None):
+    """
+    List forms together with their full details in a single call.
+
+    Lists one page of forms and then fetches the details of every form on
+    that page concurrently. Use this instead of calling TALLY_LIST_FORMS
+    followed by TALLY_GET_FORM for each result.
+
+    Args:
+        page (int, optional): The page number of results to retrieve. Defaults to 1.
+        limit (int, optional): Number of forms per page (max 100). Defaults to 20.
+        workspaceId (str, optional): If provided, only forms belonging to
+            the specified workspace will be returned.
+
+    Returns:
+        dict: The same structure as TALLY_LIST_FORMS, except that each entry
+            in items is the full form as returned by TALLY_GET_FORM
+            (including blocks and settings). A form whose details could not
+            be fetched is returned as its id plus the error.
+
+    Raises:
+        400 Bad Request: If invalid parameters are provided.
+        401 Unauthorized: If the API key is missing or invalid.
+        403 Forbidden: If the user does not have access to the workspace.
+    """
+    params = _filter_none({"page": page, "limit": min(limit, MAX_DETAILED_FORMS), "workspaceIds": workspaceId})
+    listing = await safe_request("GET", "/forms", params=params, cache_ttl=TALLY_CACHE_TTL)
+    if is_error(listing):
+        return listing
+
+    ids = [form["id"] for form in listing.get("items", [])]
+    details = await asyncio.gather(*(
+        safe_request("GET", f"/forms/{form_id}", cache_ttl=TALLY_CACHE_TTL) for form_id in ids
+    ))
+    items = [
+        {"id": form_id, **detail} if is_error(detail) else detail
+        for form_id, detail in zip(ids, details)
+    ]
+    return {**listing, "items": items}
 
 @mcp.tool()
 async def TALLY_DELETE_FORM(formId: str):
@@ -244,7 +731,9 @@ async def TALLY_DELETE_FORM(formId: str):
         403 Forbidden: If the user does not have permission to delete the form.
         404 Not Found: If the form with the given ID does not exist.
     """
-    return await safe_request("DELETE", f"{TALLY_API_BASE}/forms/{formId}")
+    result = await safe_request("DELETE", f"/forms/{formId}")
+    invalidate_cache("/forms", formId)
+    return result
 
 @mcp.tool()
 async def TALLY_GET_FORM(formId: str):
@@ -271,7 +760,7 @@ async def TALLY_GET_FORM(formId: str):
         403 Forbidden: If the user does not have permission to view the form.
         404 Not Found: If the form with the given ID does not exist.
     """
-    return await safe_request("GET", f"{TALLY_API_BASE}/forms/{formId}")
+    return await safe_request("GET", f"/forms/{formId}", cache_ttl=TALLY_CACHE_TTL)
 
 @mcp.tool()
 async def TALLY_CREATE_FORM(
@@ -342,11 +831,16 @@ async def TALLY_CREATE_FORM(
     - Don't use wrong groupType values
     - Don't create forms with empty blocks array
     """
-    payload = {"status": status, "blocks": blocks}
-    if workspaceId: payload["workspaceId"] = workspaceId
-    if templateId: payload["templateId"] = templateId
-    if settings: payload["settings"] = settings
-    return await safe_request("POST", f"{TALLY_API_BASE}/forms", json=payload)
+    payload = _filter_none({
+        "status": status,
+        "blocks": blocks,
+        "workspaceId": workspaceId,
+        "templateId": templateId,
+        "settings": settings,
+    })
+    result = await safe_request("POST", "/forms", json=payload)
+    invalidate_cache("/forms")
+    return result
 
 
 @mcp.tool()
@@ -397,12 +891,15 @@ async def TALLY_UPDATE_FORM(
         403 Forbidden: If the user does not have permission.
         404 Not Found: If the formId does not exist.
     """
-    payload = {}
-    if name: payload["name"] = name
-    if status: payload["status"] = status
-    if blocks: payload["blocks"] = blocks
-    if settings: payload["settings"] = settings
-    return await safe_request("PATCH", f"{TALLY_API_BASE}/forms/{formId}", json=payload)
+    payload = _filter_none({
+        "name": name,
+        "status": status,
+        "blocks": blocks,
+        "settings": settings,
+    })
+    result = await safe_request("PATCH", f"/forms/{formId}", json=payload)
+    invalidate_cache("/forms", formId)
+    return result
 
 @mcp.tool()
 async def TALLY_LIST_FORM_QUESTIONS(formId: str) -> Dict:
@@ -431,7 +928,7 @@ async def TALLY_LIST_FORM_QUESTIONS(formId: str) -> Dict:
         403 Forbidden: If the user does not have permission.
         404 Not Found: If the formId does not exist.
     """
-    return await safe_request("GET", f"{TALLY_API_BASE}/forms/{formId}/questions")
+    return await safe_request("GET", f"/forms/{formId}/questions", cache_ttl=TALLY_CACHE_TTL)
 
 @mcp.tool()
 async def TALLY_LIST_SUBMISSIONS(
@@ -440,7 +937,8 @@ async def TALLY_LIST_SUBMISSIONS(
     filter: Optional[str] = "all",
     startDate: Optional[str] = None,
     endDate: Optional[str] = None,
-    afterId: Optional[str] = None
+    afterId: Optional[str] = None,
+    limit: Optional[int] = None
 ) -> Dict:
     """
     List all submissions for a given Tally form.
@@ -456,6 +954,8 @@ async def TALLY_LIST_SUBMISSIONS(
         startDate (str, optional): ISO 8601 date (YYYY-MM-DD) to start filtering submissions.
         endDate (str, optional): ISO 8601 date (YYYY-MM-DD) to end filtering submissions.
         afterId (str, optional): Return submissions after the specified submission ID.
+        limit (int, optional): Number of submissions per page. Set a small value
+            when only the first few submissions are needed. Default is the API's page size.
 
     Returns:
         dict: Contains submission details, including:
@@ -471,11 +971,112 @@ async def TALLY_LIST_SUBMISSIONS(
         403 Forbidden: If the user does not have permission.
         404 Not Found: If the formId does not exist.
     """
-    params = {"page": page, "filter": filter}
-    if startDate: params["startDate"] = startDate
-    if endDate: params["endDate"] = endDate
-    if afterId: params["afterId"] = afterId
-    return await safe_request("GET", f"{TALLY_API_BASE}/forms/{formId}/submissions", params=params)
+    params = _filter_none({
+        "page": page,
+        "filter": filter,
+        "startDate": startDate,
+        "endDate": endDate,
+        "afterId": afterId,
+        "limit": limit,
+    })
+    return await safe_request("GET", f"/forms/{formId}/submissions", params=params)
+
+@mcp.tool()
+async def TALLY_LIST_SUBMISSIONS_RANGE(
+    formId: str,
+    startPage: int = 1,
+    endPage: int = 5,
+    filter: Optional[str] = "all",
+    startDate: Optional[str] = None,
+    endDate: Optional[str] = None
+) -> Dict:
+    """
+    List submissions across a range of pages in a single call.
+
+    Fetches every page from startPage to endPage concurrently and merges the
+    submissions into one list. Use this instead of calling
+    TALLY_LIST_SUBMISSIONS page by page when you need many pages at once.
+
+    Args:
+        formId (str): Unique ID of the form (from TALLY_LIST_FORMS or TALLY_GET_FORM).
+        startPage (int, optional): First page to fetch. Default is 1.
+        endPage (int, optional): Last page to fetch (inclusive). Default is 5.
+            A range can span at most 50 pages.
+        filter (str, optional): Filter submissions by status.
+            Options: "all", "completed", "draft". Default is "all".
+        startDate (str, optional): ISO 8601 date (YYYY-MM-DD) to start filtering submissions.
+        endDate (str, optional): ISO 8601 date (YYYY-MM-DD) to end filtering submissions.
+
+    Returns:
+        dict: Merged results, including:
+            - submissions (list): Submissions from all fetched pages, in page order
+            - questions (list): Form questions, taken from the first successful page
+            - hasMore (bool): Whether pages exist after endPage
+            - errors (list): Pages that failed, each with its page number and error
+
+    Raises:
+        400 Bad Request: If the page range is invalid.
+        401 Unauthorized: If the API key is missing or invalid.
+        403 Forbidden: If the user does not have permission.
+        404 Not Found: If the formId does not exist.
+    """
+    invalid = check_page_range(startPage, endPage)
+    if invalid:
+        return invalid
+
+    params = _filter_none({"filter": filter, "startDate": startDate, "endDate": endDate})
+    pages = await gather_pages(f"/forms/{formId}/submissions", startPage, endPage, params)
+
+    merged = {"submissions": [], "questions": None, "hasMore": False, "errors": []}
+    for page, result in enumerate(pages, start=startPage):
+        if is_error(result):
+            merged["errors"].append({"page": page, **result})
+            continue
+        merged["submissions"].extend(result.get("submissions", []))
+        if merged["questions"] is None:
+            merged["questions"] = result.get("questions")
+        merged["hasMore"] = result.get("hasMore", False)
+    return merged
+
+@mcp.tool()
+async def TALLY_COUNT_SUBMISSIONS(
+    formId: str,
+    startDate: Optional[str] = None,
+    endDate: Optional[str] = None
+) -> Dict:
+    """
+    Count the submissions of a Tally form without downloading them.
+
+    Requests a single-item page and returns only the per-filter totals that
+    Tally reports alongside every submissions page. Use this instead of
+    TALLY_LIST_SUBMISSIONS when you only need to know how many responses a
+    form has.
+
+    Args:
+        formId (str): Unique ID of the form (from TALLY_LIST_FORMS or TALLY_GET_FORM).
+        startDate (str, optional): ISO 8601 date (YYYY-MM-DD) to start counting from.
+        endDate (str, optional): ISO 8601 date (YYYY-MM-DD) to stop counting at.
+
+    Returns:
+        dict: Submission counts, including:
+            - formId (str): The form that was counted
+            - totalNumberOfSubmissionsPerFilter (dict): Totals keyed by filter,
+              e.g. {"all": 120, "completed": 100, "partial": 20}
+
+    Raises:
+        400 Bad Request: If the formId is invalid or parameters are malformed.
+        401 Unauthorized: If the API key is missing or invalid.
+        403 Forbidden: If the user does not have permission.
+        404 Not Found: If the formId does not exist.
+    """
+    params = _filter_none({"page": 1, "limit": 1, "startDate": startDate, "endDate": endDate})
+    result = await safe_request("GET", f"/forms/{formId}/submissions", params=params)
+    if is_error(result):
+        return result
+    return {
+        "formId": formId,
+        "totalNumberOfSubmissionsPerFilter": result.get("totalNumberOfSubmissionsPerFilter"),
+    }
 
 @mcp.tool()
 async def TALLY_GET_SUBMISSION(formId: str, submissionId: str) -> Dict:
@@ -503,7 +1104,47 @@ async def TALLY_GET_SUBMISSION(formId: str, submissionId: str) -> Dict:
         403 Forbidden: If the user does not have permission to access the submission.
         404 Not Found: If the form or submission does not exist.
     """
-    return await safe_request("GET", f"{TALLY_API_BASE}/forms/{formId}/submissions/{submissionId}")
+    return await safe_request("GET", f"/forms/{formId}/submissions/{submissionId}")
+
+@mcp.tool()
+async def TALLY_GET_SUBMISSIONS_BULK(formId: str, submissionIds: List[str]) -> Dict:
+    """
+    Retrieve several submissions of a Tally form in a single call.
+
+    Fetches every requested submission concurrently (bounded by the
+    server-wide request limit). Use this instead of calling
+    TALLY_GET_SUBMISSION once per submission.
+
+    Args:
+        formId (str): Unique ID of the form (from TALLY_LIST_FORMS or TALLY_GET_FORM).
+        submissionIds (List[str]): IDs of the submissions to fetch (from
+            TALLY_LIST_SUBMISSIONS). At most 100 per call.
+
+    Returns:
+        dict: A dictionary containing:
+            - submissions (list): One entry per requested ID, in the same
+              order, with the same structure as TALLY_GET_SUBMISSION. A
+              submission that could not be fetched is returned as its id
+              plus the error.
+
+    Raises:
+        400 Bad Request: If more than 100 IDs are requested.
+        401 Unauthorized: If the API key is missing or invalid.
+        403 Forbidden: If the user does not have permission to access the submissions.
+    """
+    if len(submissionIds) > MAX_BULK_SUBMISSIONS:
+        return {"status": 400, "error": f"At most {MAX_BULK_SUBMISSIONS} submissions can be fetched per call"}
+
+    results = await asyncio.gather(*(
+        safe_request("GET", f"/forms/{formId}/submissions/{submission_id}")
+        for submission_id in submissionIds
+    ))
+    return {
+        "submissions": [
+            {"id": submission_id, **result} if is_error(result) else result
+            for submission_id, result in zip(submissionIds, results)
+        ]
+    }
 
 @mcp.tool()
 async def TALLY_DELETE_SUBMISSION(formId: str, submissionId: str) -> Dict:  
@@ -528,7 +1169,9 @@ async def TALLY_DELETE_SUBMISSION(formId: str, submissionId: str) -> Dict:
         403 Forbidden: If the user does not have permission to delete the submission.
         404 Not Found: If the form or submission does not exist.
     """
-    return await safe_request("DELETE", f"{TALLY_API_BASE}/forms/{formId}/submissions/{submissionId}")
+    result = await safe_request("DELETE", f"/forms/{formId}/submissions/{submissionId}")
+    invalidate_cache("/forms", formId)
+    return result
 
 @mcp.tool()
 async def TALLY_GET_FORM_SETTINGS(formId: str):
@@ -569,7 +1212,7 @@ async def TALLY_GET_FORM_SETTINGS(formId: str):
         403 Forbidden: No access to the form
         404 Not Found: Form does not exist
     """
-    return await safe_request("GET", f"{TALLY_API_BASE}/forms/{formId}")
+    return await safe_request("GET", f"/forms/{formId}", cache_ttl=TALLY_CACHE_TTL)
 
 # ------------------------------------------------
 #            Webhooks
@@ -609,7 +1252,8 @@ async def TALLY_LIST_WEBHOOKS(page: int = 1, limit: int = 25) -> Dict:
         401 Unauthorized: API key missing or invalid
         403 Forbidden: Insufficient permissions
     """
-    return await safe_request("GET", f"{TALLY_API_BASE}/webhooks", params={"page": page, "limit": min(limit, 100)})
+    params = {"page": page, "limit": min(limit, 100)}
+    return await safe_request("GET", "/webhooks", params=params, cache_ttl=TALLY_CACHE_TTL)
 
 @mcp.tool()
 async def TALLY_CREATE_WEBHOOK(
@@ -652,11 +1296,17 @@ async def TALLY_CREATE_WEBHOOK(
         403 Forbidden: Insufficient permissions
         400 Bad Request: Invalid input data
     """
-    payload = {"formId": formId, "url": url, "eventTypes": eventTypes}
-    if signingSecret: payload["signingSecret"] = signingSecret
-    if httpHeaders: payload["httpHeaders"] = httpHeaders
-    if externalSubscriber: payload["externalSubscriber"] = externalSubscriber
-    return await safe_request("POST", f"{TALLY_API_BASE}/webhooks", json=payload)
+    payload = _filter_none({
+        "formId": formId,
+        "url": url,
+        "eventTypes": eventTypes,
+        "signingSecret": signingSecret,
+        "httpHeaders": httpHeaders,
+        "externalSubscriber": externalSubscriber,
+    })
+    result = await safe_request("POST", "/webhooks", json=payload)
+    invalidate_cache("/webhooks")
+    return result
 
 @mcp.tool()
 async def TALLY_UPDATE_WEBHOOK(
@@ -703,10 +1353,17 @@ async def TALLY_UPDATE_WEBHOOK(
         403 Forbidden: Insufficient permissions
         400 Bad Request: Invalid input data
     """
-    payload = {"formId": formId, "url": url, "eventTypes": eventTypes, "isEnabled": isEnabled}
-    if signingSecret: payload["signingSecret"] = signingSecret
-    if httpHeaders: payload["httpHeaders"] = httpHeaders
-    return await safe_request("PATCH", f"{TALLY_API_BASE}/webhooks/{webhookId}", json=payload)
+    payload = _filter_none({
+        "formId": formId,
+        "url": url,
+        "eventTypes": eventTypes,
+        "isEnabled": isEnabled,
+        "signingSecret": signingSecret,
+        "httpHeaders": httpHeaders,
+    })
+    result = await safe_request("PATCH", f"/webhooks/{webhookId}", json=payload)
+    invalidate_cache("/webhooks", webhookId)
+    return result
 
 @mcp.tool()
 async def TALLY_DELETE_WEBHOOK(webhookId: str):
@@ -725,11 +1382,18 @@ async def TALLY_DELETE_WEBHOOK(webhookId: str):
             - message: str (confirmation message)
 
     Raises:
+        400 Bad Request: If webhookId is empty or malformed.
         401 Unauthorized: Invalid API key
         403 Forbidden: Insufficient permissions
         404 Not Found: Webhook ID does not exist
     """
-    return await safe_request("DELETE", f"{TALLY_API_BASE}/webhooks/{webhookId}")
+    invalid = check_id("webhookId", webhookId)
+    if invalid:
+        return invalid
+
+    result = await safe_request("DELETE", f"/webhooks/{webhookId}")
+    invalidate_cache("/webhooks", webhookId)
+    return result
 
 @mcp.tool()
 async def TALLY_LIST_WEBHOOK_EVENTS(webhookId: str, page: Optional[int] = 1):
@@ -752,12 +1416,235 @@ async def TALLY_LIST_WEBHOOK_EVENTS(webhookId: str, page: Optional[int] = 1):
             - createdAt: str, timestamp of the event
 
     Raises:
+        400 Bad Request: If webhookId is empty or malformed, or page is below 1.
         401 Unauthorized: Invalid API key
         403 Forbidden: Insufficient permissions
         404 Not Found: Webhook ID does not exist
     """
-    return await safe_request("GET", f"{TALLY_API_BASE}/webhooks/{webhookId}/events", params={"page": page})
+    invalid = check_id("webhookId", webhookId)
+    if invalid:
+        return invalid
+    if page is None:
+        page = 1
+    if page < 1:
+        return {"status": 400, "error": "page must be >= 1"}
+
+    return await safe_request(
+        "GET",
+        f"/webhooks/{webhookId}/events",
+        params={"page": page},
+        cache_ttl=WEBHOOK_EVENTS_CACHE_TTL,
+    )
+
+@mcp.tool()
+async def TALLY_LIST_WEBHOOK_EVENTS_RANGE(webhookId: str, startPage: int = 1, endPage: int = 5) -> Dict:
+    """
+    List the events of a webhook across a range of pages in a single call.
+
+    Fetches every page from startPage to endPage concurrently. Use this instead
+    of calling TALLY_LIST_WEBHOOK_EVENTS page by page when you need a webhook's
+    delivery history. A failed page does not fail the others.
+
+    Args:
+        webhookId (str): The unique ID of the webhook to fetch events for.
+        startPage (int, optional): First page to fetch. Defaults to 1.
+        endPage (int, optional): Last page to fetch (inclusive). Defaults to 5.
+            A range can span at most 50 pages.
+
+    Returns:
+        dict: Results by page, including:
+            - pages (dict): Each fetched page number mapped to the page of events,
+              as returned by TALLY_LIST_WEBHOOK_EVENTS
+            - errors (list): Pages that failed, each with its page number and error
+
+    Raises:
+        400 Bad Request: If webhookId is malformed or the page range is invalid.
+        401 Unauthorized: Invalid API key
+        403 Forbidden: Insufficient permissions
+        404 Not Found: Webhook ID does not exist
+    """
+    invalid = check_id("webhookId", webhookId) or check_page_range(startPage, endPage)
+    if invalid:
+        return invalid
+
+    pages = await gather_pages(f"/webhooks/{webhookId}/events", startPage, endPage)
+
+    merged = {"pages": {}, "errors": []}
+    for page, result in enumerate(pages, start=startPage):
+        if is_error(result):
+            merged["errors"].append({"page": page, **result})
+        else:
+            merged["pages"][page] = result
+    return merged
+
+# ------------------------------------------------
+#            Batch
+# ------------------------------------------------
+BATCH_METHODS = {"GET", "POST", "PATCH", "DELETE"}
+
+# "$<call index>.<dotted.path>", e.g. "$0.items.0.id"
+_BATCH_REF = re.compile(r"\$(\d+)((?:\.[\w-]+)*)")
+
+
+def _batch_refs(value, embedded: bool = False) -> set:
+    """
+    Return the call indices referenced by placeholders in value.
+
+    Strings in params/json are only treated as a placeholder when the whole
+    string is one; in the path (embedded=True) placeholders may appear
+    anywhere, e.g. "/forms/$0.id/questions".
+    """
+    if isinstance(value, str):
+        if embedded:
+            return {int(m.group(1)) for m in _BATCH_REF.finditer(value)}
+        whole = _BATCH_REF.fullmatch(value)
+        return {int(whole.group(1))} if whole else set()
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, list):
+        return set().union(*(_batch_refs(v) for v in value))
+    return set()
+
+
+def _batch_lookup(results: list, index: int, dotted: str):
+    """Walk a dotted path (dict keys or list indices) into an earlier call's result."""
+    value = results[index]
+    for part in dotted.split(".")[1:]:
+        value = value[int(part)] if isinstance(value, list) else value[part]
+    return value
+
+
+def _batch_resolve(value, results: list, embedded: bool = False):
+    """Replace placeholders in value with data from earlier results."""
+    if isinstance(value, str):
+        if embedded:
+            return _BATCH_REF.sub(
+                lambda m: str(_batch_lookup(results, int(m.group(1)), m.group(2))), value
+            )
+        whole = _BATCH_REF.fullmatch(value)
+        return _batch_lookup(results, int(whole.group(1)), whole.group(2)) if whole else value
+    if isinstance(value, dict):
+        return {k: _batch_resolve(v, results) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_batch_resolve(v, results) for v in value]
+    return value
+
+
+async def _run_batch_call(call: dict, deps: set, results: list):
+    """Run one batch call once its dependencies have finished."""
+    failed = sorted(d for d in deps if is_error(results[d]))
+    if failed:
+        return {"status": 424, "error": f"Dependency failed: call {failed[0]}"}
+    try:
+        path = _batch_resolve(call["path"], results, embedded=True)
+        params = _batch_resolve(call.get("params"), results)
+        body = _batch_resolve(call.get("json"), results)
+    except (KeyError, IndexError, ValueError, TypeError) as e:
+        return {"status": 400, "error": f"Could not resolve placeholder: {e!r}"}
+    if not path.startswith("/") or path.startswith("//"):
+        return {"status": 400, "error": f"Resolved path must be relative to the Tally API: {path}"}
+    # A "." or ".." segment (also percent-encoded) would reach another route
+    # than the one written; query parameters belong in params.
+    if "?" in path or "#" in path or any(unquote(s) in (".", "..") for s in path.split("/")):
+        return {"status": 400, "error": f"Resolved path must not contain '.' or '..' segments or a query string: {path}"}
+
+    method = call["method"].upper()
+    result = await safe_request(method, path, params=params, json=body)
+    if method != "GET":
+        # Keep the response cache consistent with writes made through the batch
+        parts = path.strip("/").split("/")
+        invalidate_cache(f"/{parts[0]}", parts[1] if len(parts) > 1 else None)
+    return result
+
+
+@mcp.tool()
+async def TALLY_BATCH(calls: List[Dict]) -> Dict:
+    """
+    Run several Tally API calls in one tool call.
+
+    Calls that do not depend on each other run concurrently; a call that
+    uses data from an earlier call waits for it. Use this to collapse a
+    chain like "list forms -> get a form -> list its questions" into a
+    single round trip instead of one tool call per step.
+
+    Args:
+        calls (List[Dict]): Up to 50 calls, each with:
+            - method (str): "GET", "POST", "PATCH" or "DELETE"
+            - path (str): API path relative to https://api.tally.so,
+              e.g. "/forms/abc123/questions"; no "." or ".." segments and
+              no query string (use params)
+            - params (dict, optional): Query parameters
+            - json (dict, optional): Request body for POST/PATCH
+            - input_from (int, optional): Index of an earlier call that
+              must finish first, even if no data is taken from it
+
+            Data from an earlier call is referenced as "$<index>.<path>",
+            e.g. "$0.items.0.id" is the id of the first item returned by
+            call 0. In path a placeholder may appear anywhere
+            ("/forms/$0.items.0.id/questions"); in params and json a value
+            must consist of the placeholder alone. Calls may only reference
+            earlier calls.
+
+            Example:
+            [
+                {"method": "GET", "path": "/forms", "params": {"limit": 1}},
+                {"method": "GET", "path": "/forms/$0.items.0.id/questions"}
+            ]
+
+    Returns:
+        dict: A dictionary containing:
+            - results (list): One result per call, in the same order. Each is
+              the API response or an error dict. A call whose dependency
+              failed returns {"status": 424, "error": "Dependency failed: ..."}.
+
+    Raises:
+        400 Bad Request: If the batch is malformed (returned for the whole batch).
+    """
+    if not isinstance(calls, list) or not calls:
+        return {"status": 400, "error": "calls must be a non-empty list"}
+    if len(calls) > MAX_BATCH_CALLS:
+        return {"status": 400, "error": f"A batch can contain at most {MAX_BATCH_CALLS} calls"}
+
+    deps = []
+    for i, call in enumerate(calls):
+        if not isinstance(call, dict) or str(call.get("method", "")).upper() not in BATCH_METHODS:
+            return {"status": 400, "error": f"Call {i}: method must be one of {sorted(BATCH_METHODS)}"}
+        if not isinstance(call.get("path"), str):
+            return {"status": 400, "error": f"Call {i}: path must be a string"}
+        call_deps = _batch_refs(call["path"], embedded=True) | _batch_refs([call.get("params"), call.get("json")])
+        if call.get("input_from") is not None:
+            call_deps.add(call["input_from"])
+        if any(not isinstance(d, int) or not 0 <= d < i for d in call_deps):
+            return {"status": 400, "error": f"Call {i}: calls may only reference earlier calls"}
+        deps.append(call_deps)
+
+    # A call runs one layer after the deepest call it depends on
+    depth = []
+    for call_deps in deps:
+        depth.append(1 + max(depth[d] for d in call_deps) if call_deps else 0)
+
+    results: list = [None] * len(calls)
+    for layer in range(max(depth) + 1):
+        indices = [i for i, d in enumerate(depth) if d == layer]
+        layer_results = await asyncio.gather(*(_run_batch_call(calls[i], deps[i], results) for i in indices))
+        for i, result in zip(indices, layer_results):
+            results[i] = result
+    return {"results": results}
 
 # ------------------- RUN -------------------
 if __name__ == "__main__":
+    # FastMCP() already installed a root handler, so force replaces it
+    logging.basicConfig(
+        level=os.getenv("TALLY_LOG_LEVEL", "INFO").upper(),
+        format="%(asctime)s - %(levelname)s - %(message)s",
+        force=True,
+    )
+    # uvloop is optional (pip install "tally-mcp-server[speed]"); it speeds up
+    # the event loop that every tool call and Tally request runs on.
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     mcp.run()
@@ -3,95 +3,406 @@ import os
 import re
 import asyncio
 import logging
+import operator
+import random
+import time
+import httpx
+import orjson
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
-from notion_client import Client
+from notion_client import AsyncClient
+from notion_client.errors import HTTPResponseError
 from mcp.server.fastmcp import FastMCP
 
 # ---------------- CONFIG ----------------
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 logger = logging.getLogger("notion_mcp")
 
-mcp = FastMCP("notion-mcp")
-
 # Use environment variable in production. If you keep a literal for testing, replace below.
 NOTION_TOKEN = os.getenv("NOTION_TOKEN")
 if not NOTION_TOKEN:
     raise RuntimeError("❌ Please set NOTION_TOKEN in environment variables.")
 
-notion = Client(auth=NOTION_TOKEN)
+# Connection pool shared by every tool call. HTTP/2 multiplexes concurrent
+# calls over one TLS connection to api.notion.com instead of opening a
+# socket each; notion_client sets the base URL, auth headers and timeout.
+NOTION_HTTPX_MAX_CONNECTIONS = int(os.getenv("NOTION_HTTPX_MAX_CONNECTIONS", "100"))
+NOTION_HTTPX_MAX_KEEPALIVE = int(os.getenv("NOTION_HTTPX_MAX_KEEPALIVE", "50"))
+NOTION_HTTPX_KEEPALIVE_EXPIRY = float(os.getenv("NOTION_HTTPX_KEEPALIVE_EXPIRY", "60.0"))
+
+# Seconds to wait for a Notion response, and for a new connection. A short
+# connect timeout fails fast on an unreachable host while large block lists
+# and database queries still have time to arrive.
+NOTION_TIMEOUT = float(os.getenv("NOTION_TIMEOUT", "30"))
+NOTION_CONNECT_TIMEOUT = float(os.getenv("NOTION_CONNECT_TIMEOUT", "5"))
+
+# Average requests per second sent to Notion, shared by every tool. Notion
+# allows an average of 3 per integration and answers bursts above it with
+# 429s; up to one second's worth may go out back to back. 0 disables pacing.
+NOTION_RATE_LIMIT = float(os.getenv("NOTION_RATE_LIMIT", "3"))
+
+# Retries for rate limited (429) and transient gateway (502/503/504) responses
+NOTION_MAX_RETRIES = int(os.getenv("NOTION_MAX_RETRIES", "4"))
+RETRY_BACKOFF_BASE = 0.5
+RETRY_BACKOFF_MAX = 30.0
+RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+# Gateway errors are only retried for endpoints that are safe to call twice,
+# matched by the name of the notion_client endpoint method.
+_READ_ONLY_ENDPOINTS = frozenset({"retrieve", "list", "query", "search", "me"})
+
+
+def retry_delay(attempt: int, headers: Optional[httpx.Headers] = None) -> float:
+    """
+    Seconds to wait before the next attempt.
+
+    Honors a numeric Retry-After header when Notion sends one, otherwise
+    uses exponential backoff with jitter. Capped at RETRY_BACKOFF_MAX.
+    """
+    if headers is not None:
+        retry_after = headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(max(float(retry_after), 0.0), RETRY_BACKOFF_MAX)
+            except ValueError:
+                pass
+    delay = RETRY_BACKOFF_BASE * (2 ** attempt) + random.uniform(0, RETRY_BACKOFF_BASE)
+    return min(delay, RETRY_BACKOFF_MAX)
+
+
+class _NotionTransport(httpx.AsyncHTTPTransport):
+    """
+    AsyncHTTPTransport that paces requests to an average of `rate` per second,
+    letting a burst of up to `rate` requests through at once.
+
+    Requests over the limit wait here rather than being sent and rejected with
+    a 429. Retries are left to safe_execute, which waits between attempts
+    without holding a request slot.
+    """
+
+    def __init__(self, rate: float, **kwargs):
+        super().__init__(**kwargs)
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._burst = max(rate, 1.0)
+        # monotonic time at which the bucket would be empty again
+        self._next_free = 0.0
+
+    async def _wait_for_slot(self) -> None:
+        now = time.monotonic()
+        next_free = max(self._next_free, now)
+        if self._interval:
+            self._next_free = next_free + self._interval
+            wait = next_free - now - (self._burst - 1) * self._interval
+        else:
+            wait = next_free - now
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await self._wait_for_slot()
+        return await super().handle_async_request(request)
+
+
+def _new_http_client() -> httpx.AsyncClient:
+    """Build the pooled, rate-limited HTTP client the Notion client sends through."""
+    return httpx.AsyncClient(
+        transport=_NotionTransport(
+            NOTION_RATE_LIMIT,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=NOTION_HTTPX_MAX_CONNECTIONS,
+                max_keepalive_connections=NOTION_HTTPX_MAX_KEEPALIVE,
+                keepalive_expiry=NOTION_HTTPX_KEEPALIVE_EXPIRY,
+            ),
+        ),
+    )
+
+
+class _OrjsonAsyncClient(AsyncClient):
+    """
+    notion_client AsyncClient that decodes successful responses with orjson.
+    Block lists and database queries can be several MB of JSON, and orjson
+    parses them several times faster than the stdlib json module httpx uses.
+    Error responses keep notion_client's own handling.
+    """
+
+    def _parse_response(self, response: httpx.Response) -> Any:
+        if response.is_success:
+            return orjson.loads(response.content)
+        return super()._parse_response(response)
+
+
+def _new_notion_client() -> _OrjsonAsyncClient:
+    """
+    Build the Notion client on a new pooled HTTP client. notion_client resets
+    the timeout to one flat value when it attaches the HTTP client, so the
+    split timeout is applied afterwards.
+    """
+    client = _OrjsonAsyncClient(auth=NOTION_TOKEN, client=_new_http_client())
+    client.client.timeout = httpx.Timeout(NOTION_TIMEOUT, connect=NOTION_CONNECT_TIMEOUT)
+    return client
+
+
+notion = _new_notion_client()
+_active_sessions = 0
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """
+    Close the shared HTTP client when the last MCP session ends.
+
+    FastMCP enters the lifespan once per session on HTTP transports, so
+    sessions are counted to avoid closing the client under a live session,
+    and a session that starts after the client was closed gets a new one.
+    """
+    global _active_sessions, notion
+    if notion.client.is_closed:
+        notion = _new_notion_client()
+    _active_sessions += 1
+    try:
+        yield
+    finally:
+        _active_sessions -= 1
+        if _active_sessions == 0:
+            await notion.client.aclose()
+
+
+mcp = FastMCP("notion-mcp", lifespan=lifespan)
+
+# Upper bound on Notion requests in flight at once, across all tools. Fan-out
+# such as page prefetching and concurrent tool calls queue here instead of
+# bursting past Notion's average of 3 requests per second per integration.
+NOTION_MAX_CONCURRENCY = int(os.getenv("NOTION_MAX_CONCURRENCY", "5"))
+
+# Notion accepts at most 100 children per blocks.children.append request
+MAX_BLOCKS_PER_APPEND = 100
+# Block fields set by Notion that must be stripped before re-creating a block
+_BLOCK_READONLY = frozenset({"id", "created_time", "last_edited_time", "created_by", "last_edited_by", "parent", "object"})
+# Block types whose content is a rich_text array, as built by NOTION_UPDATE_BLOCK
+_TEXT_BLOCK_TYPES = frozenset({
+    "paragraph", "heading_1", "heading_2", "heading_3",
+    "bulleted_list_item", "numbered_list_item", "quote", "to_do",
+})
+# search filters by object type, built once and shared by every search call
+# (notion_client only reads them)
+_OBJECT_FILTERS = {
+    "page": {"property": "object", "value": "page"},
+    "database": {"property": "object", "value": "database"},
+}
+# Property types computed by Notion; pages.create rejects values for them
+_NON_CREATABLE_TYPES = frozenset({
+    "rollup", "formula", "button", "unique_id",
+    "created_time", "created_by", "last_edited_time", "last_edited_by",
+})
+
+# Seconds to remember the name of a page's title property. Renaming the
+# title property is rare, and NOTION_UPDATE_PAGE otherwise retrieves the
+# page on every title change just to find it. Schema updates through this
+# server drop every remembered name.
+TITLE_KEY_CACHE_TTL = 300
+# Seconds to serve databases.retrieve, blocks.retrieve and users.me results
+# from memory. Agents exploring a workspace fetch the same metadata over and
+# over; writes through this server drop the affected entries, and
+# NOTION_INVALIDATE_CACHE drops them on demand. 0 disables the cache.
+NOTION_METADATA_CACHE_TTL = float(os.getenv("NOTION_METADATA_CACHE_TTL", "60"))
+# Seconds to serve pages.retrieve results (NOTION_FETCH_ROW, and the page
+# lookups in NOTION_DUPLICATE_PAGE and NOTION_UPDATE_PAGE) from memory. Page
+# properties change more often than schemas, so this is shorter; page
+# updates, and property changes to the page's database, through this server
+# drop the entry. 0 disables the cache.
+NOTION_PAGE_CACHE_TTL = float(os.getenv("NOTION_PAGE_CACHE_TTL", "30"))
+# Seconds to serve repeated search and comment listings (NOTION_SEARCH_NOTION_PAGE,
+# NOTION_FETCH_DATA, NOTION_FETCH_COMMENTS) from memory. Page and database
+# writes drop cached searches, new comments drop that page's listings.
+# 0 disables the cache.
+NOTION_READ_CACHE_TTL = float(os.getenv("NOTION_READ_CACHE_TTL", "60"))
+CACHE_MAX_ENTRIES = 2048
 
 # ---------------- HELPERS ----------------
-_UUID_RE = re.compile(r"^[0-9a-fA-F-]{32,36}$")
+# 32 hex digits, either bare or dashed 8-4-4-4-12
+_UUID_RE = re.compile(r"[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}")
 
 
 def validate_notion_id(notion_id: str) -> bool:
-    if not notion_id or not isinstance(notion_id, str):
+    if not isinstance(notion_id, str) or len(notion_id) not in (32, 36):
         return False
-    return bool(_UUID_RE.match(notion_id))
+    return _UUID_RE.fullmatch(notion_id) is not None
+
+
+@lru_cache(maxsize=4096)
+def normalize_notion_id(notion_id: str) -> str:
+    """
+    Return a Notion ID in the dashed, lowercase 8-4-4-4-12 form Notion itself
+    returns, so the same object always maps to the same cache key. Strings
+    that are not 32 hex digits are returned unchanged.
+    """
+    digits = notion_id.replace("-", "").lower()
+    if len(digits) != 32:
+        return notion_id
+    return f"{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}"
 
 
 def _func_name(func) -> str:
-    # Some Notion client endpoints are bound objects without __name__
-    return getattr(func, "__name__", getattr(func, "__qualname__", func.__class__.__name__))
+    # Endpoints are bound methods (e.g. "UsersEndpoint.me"); fall back to the
+    # class name for callable endpoint objects
+    return getattr(func, "__qualname__", func.__class__.__name__)
+
+
+_request_slots = asyncio.Semaphore(NOTION_MAX_CONCURRENCY)
+# monotonic time until which every call waits after Notion answered 429, so
+# concurrent tool calls back off together
+_rate_limited_until = 0.0
 
 
-def safe_execute(func, *args, **kwargs):
+async def safe_execute(func, *args, **kwargs):
     """
-    Calls Notion client endpoint or a function and returns structured JSON.
-    Works when `func` is a bound endpoint object (no __name__).
+    Awaits a Notion client endpoint or a coroutine function and returns structured JSON.
+    Pass the endpoint itself (e.g. notion.pages.retrieve), not a wrapper around it.
+
+    Rate limited (429) responses are retried for every endpoint, transient
+    gateway errors only for read-only ones. Each attempt holds one of the
+    NOTION_MAX_CONCURRENCY request slots; the slot is released while waiting
+    to retry.
     """
+    global _rate_limited_until
+    retry_transient = getattr(func, "__name__", None) in _READ_ONLY_ENDPOINTS
     try:
-        data = func(*args, **kwargs)
-        logger.info("✅ Success calling %s", _func_name(func))
-        return {"successful": True, "data": data, "error": None}
+        for attempt in range(NOTION_MAX_RETRIES + 1):
+            wait = _rate_limited_until - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                async with _request_slots:
+                    data = await func(*args, **kwargs)
+            except HTTPResponseError as e:
+                rate_limited = e.status == 429
+                transient = retry_transient and e.status in RETRYABLE_STATUS_CODES
+                if attempt == NOTION_MAX_RETRIES or not (rate_limited or transient):
+                    raise
+                delay = retry_delay(attempt, e.headers)
+                if rate_limited:
+                    _rate_limited_until = max(_rate_limited_until, time.monotonic() + delay)
+                logger.warning("%s returned %s, retrying in %.1fs", _func_name(func), e.status, delay)
+                await asyncio.sleep(delay)
+                continue
+            # skip the name lookup entirely when per-call INFO logs are off
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("✅ Success calling %s", _func_name(func))
+            return {"successful": True, "data": data, "error": None}
     except Exception as e:
         logger.exception("❌ Error calling %s", _func_name(func))
         return {"successful": False, "data": {}, "error": str(e)}
 
 
-def _collect_all_pages_query(database_id: str, page_size: int = 100) -> Dict[str, Any]:
+# ---------------- CACHE ----------------
+# key -> (expires_at, value), kept in LRU order.
+_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+
+def cache_get(key: tuple):
+    """Return a cached value if it has not expired, otherwise None."""
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if expires_at <= time.monotonic():
+        del _cache[key]
+        return None
+    _cache.move_to_end(key)
+    return value
+
+
+def cache_put(key: tuple, value, ttl: float):
+    """Store a value, evicting the least recently used entry when full."""
+    _cache[key] = (time.monotonic() + ttl, value)
+    _cache.move_to_end(key)
+    while len(_cache) > CACHE_MAX_ENTRIES:
+        _cache.popitem(last=False)
+
+
+def cache_delete(key: tuple):
+    """Drop a cached value if present."""
+    _cache.pop(key, None)
+
+
+def cache_invalidate(object_id: Optional[str] = None, kind: Optional[str] = None) -> int:
     """
-    Helper to collect all pages from databases.query with pagination.
-    Returns dict with results list and next_cursor (None if done).
+    Drop cached entries for object_id and/or of the given kind (the first
+    element of the key, e.g. "search"); the whole cache if both are None.
+    Returns the number of entries dropped.
     """
-    all_results = []
-    start_cursor = None
-    while True:
-        kwargs = {"database_id": database_id, "page_size": page_size}
-        if start_cursor:
-            kwargs["start_cursor"] = start_cursor
-        res = safe_execute(lambda **kw: notion.databases.query(**kw), **kwargs)
-        if not res["successful"]:
-            return res
-        page_data = res["data"]
-        all_results.extend(page_data.get("results", []))
-        start_cursor = page_data.get("next_cursor")
-        if not start_cursor:
-            break
-    return {"successful": True, "data": {"results": all_results}, "error": None}
-
-
-def _collect_all_blocks(block_id: str, page_size: int = 100) -> Dict[str, Any]:
-    """Collect all children blocks for a block/page with pagination."""
-    all_results = []
-    start_cursor = None
-    while True:
-        kwargs = {"block_id": block_id, "page_size": page_size}
-        if start_cursor:
-            kwargs["start_cursor"] = start_cursor
-        res = safe_execute(lambda **kw: notion.blocks.children.list(**kw), **kwargs)
+    if object_id is None and kind is None:
+        dropped = len(_cache)
+        _cache.clear()
+        return dropped
+    keys = [
+        key for key in _cache
+        if (kind is None or key[0] == kind) and (object_id is None or object_id in key[1:])
+    ]
+    for key in keys:
+        del _cache[key]
+    return len(keys)
+
+
+def request_key(kwargs: Dict[str, Any]) -> bytes:
+    """Hashable cache key for a request's arguments, independent of key order."""
+    return orjson.dumps(kwargs, option=orjson.OPT_SORT_KEYS)
+
+
+async def cached_execute(key: tuple, func, *, cache_ttl: float = NOTION_METADATA_CACHE_TTL, **kwargs):
+    """
+    safe_execute() for read-only endpoints, serving successful results from
+    the cache for cache_ttl seconds (NOTION_METADATA_CACHE_TTL by default).
+    """
+    data = cache_get(key)
+    if data is not None:
+        return {"successful": True, "data": data, "error": None}
+    res = await safe_execute(func, **kwargs)
+    if res["successful"] and cache_ttl > 0:
+        cache_put(key, res["data"], cache_ttl)
+    return res
+
+
+async def _iter_result_pages(func, **kwargs):
+    """
+    Yield safe_execute results for every page of a paginated Notion endpoint.
+
+    The request for the next page is sent as soon as the current page arrives,
+    so it is in flight while the caller works through the current results.
+    Stops after the last page, or after yielding the first failed result.
+    """
+    pending = asyncio.ensure_future(safe_execute(func, **kwargs))
+    try:
+        while pending is not None:
+            res = await pending
+            pending = None
+            next_cursor = res["data"].get("next_cursor") if res["successful"] else None
+            if next_cursor:
+                pending = asyncio.ensure_future(safe_execute(func, **kwargs, start_cursor=next_cursor))
+            yield res
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+async def _project_all_pages(func, project, **kwargs) -> Optional[List[Any]]:
+    """
+    Apply project() to every result of a paginated endpoint, one page at a time,
+    so only the projections are kept rather than every full result object.
+    Returns None if any page fails.
+    """
+    projected = []
+    async for res in _iter_result_pages(func, **kwargs):
         if not res["successful"]:
-            return res
-        all_results.extend(res["data"].get("results", []))
-        start_cursor = res["data"].get("next_cursor")
-        if not start_cursor:
-            break
-    return {"successful": True, "data": {"results": all_results}, "error": None}
+            return None
+        projected.extend(map(project, res["data"].get("results", [])))
+    return projected
 
 
 # ---------------- USER TOOLS ----------------
 @mcp.tool()
-def NOTION_GET_ABOUT_ME():
+async def NOTION_GET_ABOUT_ME():
     """
     Retrieve details about the authenticated Notion user.
     
@@ -101,11 +412,11 @@ def NOTION_GET_ABOUT_ME():
     Returns:
         dict: User information including id, name, email, avatar_url, and other metadata
     """
-    return safe_execute(lambda **kw: notion.users.me(**kw))
+    return await cached_execute(("me",), notion.users.me)
 
 
 @mcp.tool()
-def NOTION_LIST_USERS(page_size: int = 30, start_cursor: Optional[str] = None):
+async def NOTION_LIST_USERS(page_size: int = 30, start_cursor: Optional[str] = None):
     """
     List all users in the Notion workspace.
     
@@ -119,7 +430,7 @@ def NOTION_LIST_USERS(page_size: int = 30, start_cursor: Optional[str] = None):
     kwargs = {"page_size": page_size}
     if start_cursor:
         kwargs["start_cursor"] = start_cursor
-    res = safe_execute(lambda **kw: notion.users.list(**kw), **kwargs)
+    res = await safe_execute(notion.users.list, **kwargs)
     if res["successful"]:
         simplified = [{"id": u.get("id"), "name": u.get("name", "Unknown")} for u in res["data"].get("results", [])]
         res["data"] = simplified
@@ -127,7 +438,7 @@ def NOTION_LIST_USERS(page_size: int = 30, start_cursor: Optional[str] = None):
 
 
 @mcp.tool()
-def NOTION_GET_ABOUT_USER(user_id: str):
+async def NOTION_GET_ABOUT_USER(user_id: str):
     """
     Retrieve details about a specific Notion user.
     
@@ -139,12 +450,12 @@ def NOTION_GET_ABOUT_USER(user_id: str):
     """
     if not validate_notion_id(user_id):
         return {"successful": False, "data": {}, "error": "Invalid user ID format"}
-    return safe_execute(lambda **kw: notion.users.retrieve(**kw), user_id=user_id)
+    return await safe_execute(notion.users.retrieve, user_id=user_id)
 
 
 # ---------------- PAGE / DUPLICATE / UPDATE TOOLS ----------------
 @mcp.tool()
-def NOTION_CREATE_NOTION_PAGE(parent_id: str, title: str, cover: Optional[str] = None, icon: Optional[str] = None):
+async def NOTION_CREATE_NOTION_PAGE(parent_id: str, title: str, cover: Optional[str] = None, icon: Optional[str] = None):
     """
     Create a new Notion page under a parent page.
     
@@ -167,11 +478,48 @@ def NOTION_CREATE_NOTION_PAGE(parent_id: str, title: str, cover: Optional[str] =
         kwargs["cover"] = {"external": {"url": cover}}
     if icon:
         kwargs["icon"] = {"emoji": icon}
-    return safe_execute(lambda **kw: notion.pages.create(**kw), **kwargs)
+    res = await safe_execute(notion.pages.create, **kwargs)
+    cache_invalidate(kind="search")
+    return res
+
+
+_PLAIN_TEXT = operator.itemgetter("plain_text")
+
+
+def _plain_text(rich_text: List[Dict[str, Any]]) -> str:
+    """Concatenate the plain_text of a rich_text array (Notion always includes it in responses)."""
+    return "".join(map(_PLAIN_TEXT, rich_text))
+
+
+def _title_key(props: Dict[str, Any]) -> Optional[str]:
+    """Return the name of the first title property in a page's properties, or None."""
+    return next((k for k, v in props.items() if type(v) is dict and "title" in v), None)
+
+
+def _extract_title(props: Dict[str, Any]) -> Optional[str]:
+    """Return the plain text of a page's title property, or None if it has none or it is empty."""
+    key = _title_key(props)
+    if key is None:
+        return None
+    return _plain_text(props[key].get("title", [])) or None
+
+
+async def _append_copied_blocks(page_id: str, blocks: List[Dict[str, Any]]) -> None:
+    """
+    Append copied blocks to a page in one request.
+    If Notion rejects the batch, retry the blocks one at a time so a single
+    block that cannot be copied does not drop the rest of the batch.
+    """
+    res = await safe_execute(notion.blocks.children.append, block_id=page_id, children=blocks)
+    if res["successful"] or len(blocks) == 1:
+        return
+    logger.warning("Failed to append %d blocks during duplication, retrying one at a time.", len(blocks))
+    for blk in blocks:
+        await safe_execute(notion.blocks.children.append, block_id=page_id, children=[blk])
 
 
 @mcp.tool()
-def NOTION_DUPLICATE_PAGE(page_id: str, parent_id: str, title: Optional[str] = None, include_blocks: bool = True):
+async def NOTION_DUPLICATE_PAGE(page_id: str, parent_id: str, title: Optional[str] = None, include_blocks: bool = True):
     """
     Duplicate an existing Notion page to a new location.
     
@@ -186,37 +534,24 @@ def NOTION_DUPLICATE_PAGE(page_id: str, parent_id: str, title: Optional[str] = N
     """
     if not validate_notion_id(page_id) or not validate_notion_id(parent_id):
         return {"successful": False, "data": {}, "error": "Invalid page_id or parent_id format"}
+    page_id = normalize_notion_id(page_id)
 
     # fetch original page metadata
-    orig_res = safe_execute(lambda **kw: notion.pages.retrieve(**kw), page_id=page_id)
+    orig_res = await cached_execute(("page", page_id), notion.pages.retrieve, cache_ttl=NOTION_PAGE_CACHE_TTL, page_id=page_id)
     if not orig_res["successful"]:
         return orig_res
     original = orig_res["data"]
 
-    # extract a reasonable title
-    orig_title = "Untitled"
-    try:
-        t_prop = original.get("properties", {})
-        # find any title property key whose value contains 'title'
-        for k, v in t_prop.items():
-            if isinstance(v, dict) and "title" in v:
-                title_parts = v.get("title", [])
-                orig_title = "".join([p.get("plain_text", "") for p in title_parts]) or orig_title
-                break
-    except Exception:
-        pass
-
+    orig_title = _extract_title(original.get("properties", {})) or "Untitled"
     new_title = title or f"Copy of {orig_title}"
 
-    # prepare properties copy - deep copy safe; but remove system-only fields if present
-    new_properties = original.get("properties", {}).copy()
+    # copy properties, dropping computed ones Notion would reject on create
+    new_properties = {
+        k: v for k, v in original.get("properties", {}).items()
+        if v.get("type") not in _NON_CREATABLE_TYPES
+    }
     # Ensure title property updated
-    # find the title property key to overwrite (first property whose value has 'title')
-    title_key = None
-    for k, v in new_properties.items():
-        if isinstance(v, dict) and "title" in v:
-            title_key = k
-            break
+    title_key = _title_key(new_properties)
     if title_key:
         new_properties[title_key] = {"title": [{"text": {"content": new_title}}]}
     else:
@@ -229,32 +564,51 @@ def NOTION_DUPLICATE_PAGE(page_id: str, parent_id: str, title: Optional[str] = N
     if original.get("icon"):
         create_payload["icon"] = original["icon"]
 
-    new_page_res = safe_execute(lambda **kw: notion.pages.create(**kw), **create_payload)
+    new_page_res = await safe_execute(notion.pages.create, **create_payload)
     if not new_page_res["successful"]:
         return new_page_res
+    cache_invalidate(kind="search")
 
     new_page_id = new_page_res["data"]["id"]
 
-    # copy blocks optionally (recursive shallow copy)
+    # copy blocks optionally (top-level blocks only). Each page of source
+    # blocks is appended as soon as it arrives while the next one is fetched.
     if include_blocks:
-        blocks_collected = _collect_all_blocks(page_id := page_id)
-        if not blocks_collected["successful"]:
-            logger.warning("Failed to collect blocks for duplication, continuing without blocks.")
-        else:
-            for blk in blocks_collected["data"].get("results", []):
-                # Remove read-only fields and keep only the block payload
-                blk_payload = {k: v for k, v in blk.items() if k not in ("id", "created_time", "last_edited_time", "created_by", "last_edited_by", "parent", "object")}
-                # append
-                try:
-                    safe_execute(lambda **kw: notion.blocks.children.append(**kw), block_id=new_page_id, children=[blk_payload])
-                except Exception as e:
-                    logger.warning("Failed to append block during duplication: %s", e)
+        async for blocks_page in _iter_result_pages(notion.blocks.children.list, block_id=page_id, page_size=MAX_BLOCKS_PER_APPEND):
+            if not blocks_page["successful"]:
+                logger.warning("Failed to collect blocks for duplication, continuing without the remaining blocks.")
+                break
+            # Remove read-only fields and keep only the block payload
+            blk_payloads = [
+                {k: v for k, v in blk.items() if k not in _BLOCK_READONLY}
+                for blk in blocks_page["data"].get("results", [])
+            ]
+            if blk_payloads:
+                await _append_copied_blocks(new_page_id, blk_payloads)
 
     return {"successful": True, "data": {"new_page_id": new_page_id, "title": new_title}, "error": None}
 
 
+async def _page_title_key(page_id: str) -> Optional[str]:
+    """
+    Return the name of a page's title property, or None if the page cannot be
+    retrieved or has none. Found names are cached for TITLE_KEY_CACHE_TTL seconds.
+    """
+    cache_key = ("title_key", page_id)
+    title_key = cache_get(cache_key)
+    if title_key is not None:
+        return title_key
+    page_meta = await cached_execute(("page", page_id), notion.pages.retrieve, cache_ttl=NOTION_PAGE_CACHE_TTL, page_id=page_id)
+    if not page_meta["successful"]:
+        return None
+    title_key = _title_key(page_meta["data"].get("properties", {}))
+    if title_key is not None:
+        cache_put(cache_key, title_key, TITLE_KEY_CACHE_TTL)
+    return title_key
+
+
 @mcp.tool()
-def NOTION_UPDATE_PAGE(page_id: str, title: Optional[str] = None, archived: Optional[bool] = None,
+async def NOTION_UPDATE_PAGE(page_id: str, title: Optional[str] = None, archived: Optional[bool] = None,
                        cover_url: Optional[str] = None, icon_emoji: Optional[str] = None, properties: Optional[Dict[str, Any]] = None):
     """
     Update properties of an existing Notion page.
@@ -272,6 +626,7 @@ def NOTION_UPDATE_PAGE(page_id: str, title: Optional[str] = None, archived: Opti
     """
     if not validate_notion_id(page_id):
         return {"successful": False, "data": {}, "error": "Invalid page_id format"}
+    page_id = normalize_notion_id(page_id)
     kwargs = {}
     if archived is not None:
         kwargs["archived"] = archived
@@ -281,32 +636,21 @@ def NOTION_UPDATE_PAGE(page_id: str, title: Optional[str] = None, archived: Opti
         kwargs["icon"] = {"emoji": icon_emoji}
     if title:
         kwargs.setdefault("properties", {})
-        # find title property name first by retrieving the page schema
-        page_meta = safe_execute(lambda **kw: notion.pages.retrieve(**kw), page_id=page_id)
-        if page_meta["successful"]:
-            page_props = page_meta["data"].get("properties", {})
-            title_key = None
-            for k, v in page_props.items():
-                if isinstance(v, dict) and "title" in v:
-                    title_key = k
-                    break
-            if title_key:
-                kwargs["properties"][title_key] = {"title": [{"text": {"content": title}}]}
-            else:
-                # fallback: set property "Name"
-                kwargs["properties"]["Name"] = {"title": [{"text": {"content": title}}]}
-        else:
-            # can't inspect page; still set a 'title' property named 'Name'
-            kwargs.setdefault("properties", {})
-            kwargs["properties"]["Name"] = {"title": [{"text": {"content": title}}]}
+        # find title property name from the page schema; fallback: "Name"
+        title_key = await _page_title_key(page_id) or "Name"
+        kwargs["properties"][title_key] = {"title": [{"text": {"content": title}}]}
     if properties:
         kwargs.setdefault("properties", {})
         kwargs["properties"].update(properties)
-    return safe_execute(lambda **kw: notion.pages.update(**kw), page_id=page_id, **kwargs)
+    res = await safe_execute(notion.pages.update, page_id=page_id, **kwargs)
+    cache_delete(("page", page_id))
+    cache_delete(("block", page_id))
+    cache_invalidate(kind="search")
+    return res
 
 
 @mcp.tool()
-def NOTION_GET_PAGE_PROPERTY_ACTION(page_id: str, property_id: str, page_size: Optional[int] = None, start_cursor: Optional[str] = None):
+async def NOTION_GET_PAGE_PROPERTY_ACTION(page_id: str, property_id: str, page_size: Optional[int] = None, start_cursor: Optional[str] = None):
     """
     Retrieve a specific property value from a Notion page.
     
@@ -327,11 +671,11 @@ def NOTION_GET_PAGE_PROPERTY_ACTION(page_id: str, property_id: str, page_size: O
         kwargs["page_size"] = page_size
     if start_cursor:
         kwargs["start_cursor"] = start_cursor
-    return safe_execute(lambda **kw: notion.pages.properties.retrieve(**kw), **kwargs)
+    return await safe_execute(notion.pages.properties.retrieve, **kwargs)
 
 
 @mcp.tool()
-def NOTION_ARCHIVE_NOTION_PAGE(page_id: str, archive: bool = True):
+async def NOTION_ARCHIVE_NOTION_PAGE(page_id: str, archive: bool = True):
     """
     Archive or unarchive a Notion page.
     
@@ -344,11 +688,16 @@ def NOTION_ARCHIVE_NOTION_PAGE(page_id: str, archive: bool = True):
     """
     if not validate_notion_id(page_id):
         return {"successful": False, "data": {}, "error": "Invalid page_id format"}
-    return safe_execute(lambda **kw: notion.pages.update(**kw), page_id=page_id, archived=archive)
+    page_id = normalize_notion_id(page_id)
+    res = await safe_execute(notion.pages.update, page_id=page_id, archived=archive)
+    cache_delete(("page", page_id))
+    cache_delete(("block", page_id))
+    cache_invalidate(kind="search")
+    return res
 
 
 @mcp.tool()
-def list_pages(keyword: Optional[str] = None):
+async def list_pages(keyword: Optional[str] = None):
     """
     Search for Notion pages by keyword.
     
@@ -358,31 +707,22 @@ def list_pages(keyword: Optional[str] = None):
     Returns:
         dict: List of pages with id, title, and url
     """
-    search_kwargs = {"filter": {"property": "object", "value": "page"}}
+    search_kwargs = {"filter": _OBJECT_FILTERS["page"]}
     if keyword:
         search_kwargs["query"] = keyword
-    res = safe_execute(lambda **kw: notion.search(**kw), **search_kwargs)
+    res = await safe_execute(notion.search, **search_kwargs)
     if not res["successful"]:
         return res
-    pages = []
-    for pg in res["data"].get("results", []):
-        title = "Untitled"
-        try:
-            props = pg.get("properties", {})
-            # find first title prop
-            for k, v in props.items():
-                if isinstance(v, dict) and "title" in v:
-                    title = "".join([t.get("plain_text", "") for t in v.get("title", [])]) or title
-                    break
-        except Exception:
-            pass
-        pages.append({"id": pg.get("id"), "title": title, "url": pg.get("url")})
+    pages = [
+        {"id": pg.get("id"), "title": _extract_title(pg.get("properties", {})) or "Untitled", "url": pg.get("url")}
+        for pg in res["data"].get("results", [])
+    ]
     return {"successful": True, "data": pages, "error": ""}
 
 
 # ---------------- DATABASE TOOLS ----------------
 @mcp.tool()
-def NOTION_CREATE_DATABASE(parent_id: str, title: str, properties: Dict[str, Any]):
+async def NOTION_CREATE_DATABASE(parent_id: str, title: str, properties: Dict[str, Any]):
     """
     Create a new Notion database under a parent page.
     
@@ -400,11 +740,13 @@ def NOTION_CREATE_DATABASE(parent_id: str, title: str, properties: Dict[str, Any
     if not any(isinstance(v, dict) and "title" in v for v in properties.values()):
         return {"successful": False, "data": {}, "error": "Database must have at least one title property"}
     payload = {"parent": {"type": "page_id", "page_id": parent_id}, "title": [{"type": "text", "text": {"content": title}}], "properties": properties}
-    return safe_execute(lambda **kw: notion.databases.create(**kw), **payload)
+    res = await safe_execute(notion.databases.create, **payload)
+    cache_invalidate(kind="search")
+    return res
 
 
 @mcp.tool()
-def NOTION_INSERT_ROW_DATABASE(database_id: str, properties: Dict[str, Any], icon: Optional[str] = None, cover: Optional[str] = None, children: Optional[List[Dict[str, Any]]] = None):
+async def NOTION_INSERT_ROW_DATABASE(database_id: str, properties: Dict[str, Any], icon: Optional[str] = None, cover: Optional[str] = None, children: Optional[List[Dict[str, Any]]] = None):
     """
     Insert a new row (page) into a Notion database.
     
@@ -427,11 +769,13 @@ def NOTION_INSERT_ROW_DATABASE(database_id: str, properties: Dict[str, Any], ico
         payload["cover"] = {"external": {"url": cover}}
     if children:
         payload["children"] = children
-    return safe_execute(lambda **kw: notion.pages.create(**kw), **payload)
+    res = await safe_execute(notion.pages.create, **payload)
+    cache_invalidate(kind="search")
+    return res
 
 
 @mcp.tool()
-def NOTION_QUERY_DATABASE(database_id: str, page_size: int = 10, sorts: Optional[List[Dict[str, Any]]] = None, start_cursor: Optional[str] = None):
+async def NOTION_QUERY_DATABASE(database_id: str, page_size: int = 10, sorts: Optional[List[Dict[str, Any]]] = None, start_cursor: Optional[str] = None):
     """
     Query a Notion database to retrieve rows with optional sorting and pagination.
     
@@ -451,11 +795,11 @@ def NOTION_QUERY_DATABASE(database_id: str, page_size: int = 10, sorts: Optional
         payload["sorts"] = [{"property": s["property"], "direction": s.get("direction", "ascending")} for s in sorts]
     if start_cursor:
         payload["start_cursor"] = start_cursor
-    return safe_execute(lambda **kw: notion.databases.query(**kw), database_id=database_id, **payload)
+    return await safe_execute(notion.databases.query, database_id=database_id, **payload)
 
 
 @mcp.tool()
-def NOTION_FETCH_DATABASE(database_id: str):
+async def NOTION_FETCH_DATABASE(database_id: str):
     """
     Retrieve metadata and schema information for a Notion database.
     
@@ -467,11 +811,12 @@ def NOTION_FETCH_DATABASE(database_id: str):
     """
     if not validate_notion_id(database_id):
         return {"successful": False, "data": {}, "error": "Invalid database_id format"}
-    return safe_execute(lambda **kw: notion.databases.retrieve(**kw), database_id=database_id)
+    database_id = normalize_notion_id(database_id)
+    return await cached_execute(("database", database_id), notion.databases.retrieve, database_id=database_id)
 
 
 @mcp.tool()
-def NOTION_FETCH_ROW(page_id: str):
+async def NOTION_FETCH_ROW(page_id: str):
     """
     Retrieve a specific row (page) from a Notion database.
     
@@ -483,11 +828,12 @@ def NOTION_FETCH_ROW(page_id: str):
     """
     if not validate_notion_id(page_id):
         return {"successful": False, "data": {}, "error": "Invalid page_id format"}
-    return safe_execute(lambda **kw: notion.pages.retrieve(**kw), page_id=page_id)
+    page_id = normalize_notion_id(page_id)
+    return await cached_execute(("page", page_id), notion.pages.retrieve, cache_ttl=NOTION_PAGE_CACHE_TTL, page_id=page_id)
 
 
 @mcp.tool()
-def NOTION_UPDATE_ROW_DATABASE(page_id: str, properties: Optional[Dict[str, Any]] = None, icon: Optional[str] = None, cover: Optional[str] = None, archived: Optional[bool] = False):
+async def NOTION_UPDATE_ROW_DATABASE(page_id: str, properties: Optional[Dict[str, Any]] = None, icon: Optional[str] = None, cover: Optional[str] = None, archived: Optional[bool] = False):
     """
     Update properties and metadata of a Notion database row.
     
@@ -503,6 +849,7 @@ def NOTION_UPDATE_ROW_DATABASE(page_id: str, properties: Optional[Dict[str, Any]
     """
     if not validate_notion_id(page_id):
         return {"successful": False, "data": {}, "error": "Invalid page_id format"}
+    page_id = normalize_notion_id(page_id)
     payload = {}
     if properties:
         payload["properties"] = properties
@@ -512,11 +859,15 @@ def NOTION_UPDATE_ROW_DATABASE(page_id: str, properties: Optional[Dict[str, Any]
         payload["cover"] = {"external": {"url": cover}}
     if archived is not None:
         payload["archived"] = archived
-    return safe_execute(lambda **kw: notion.pages.update(**kw), page_id=page_id, **payload)
+    res = await safe_execute(notion.pages.update, page_id=page_id, **payload)
+    cache_delete(("page", page_id))
+    cache_delete(("block", page_id))
+    cache_invalidate(kind="search")
+    return res
 
 
 @mcp.tool()
-def NOTION_UPDATE_SCHEMA_DATABASE(database_id: str, title: Optional[str] = None, description: Optional[str] = None, properties: Optional[Dict[str, Any]] = None):
+async def NOTION_UPDATE_SCHEMA_DATABASE(database_id: str, title: Optional[str] = None, description: Optional[str] = None, properties: Optional[Dict[str, Any]] = None):
     """
     Update the schema and metadata of a Notion database.
     
@@ -531,6 +882,7 @@ def NOTION_UPDATE_SCHEMA_DATABASE(database_id: str, title: Optional[str] = None,
     """
     if not validate_notion_id(database_id):
         return {"successful": False, "data": {}, "error": "Invalid database_id format"}
+    database_id = normalize_notion_id(database_id)
     payload = {}
     if title:
         payload["title"] = [{"type": "text", "text": {"content": title}}]
@@ -538,7 +890,20 @@ def NOTION_UPDATE_SCHEMA_DATABASE(database_id: str, title: Optional[str] = None,
         payload["description"] = [{"type": "text", "text": {"content": description}}]
     if properties:
         payload["properties"] = properties
-    return safe_execute(lambda **kw: notion.databases.update(**kw), database_id=database_id, **payload)
+    res = await safe_execute(notion.databases.update, database_id=database_id, **payload)
+    cache_delete(("database", database_id))
+    cache_invalidate(kind="search")
+    if properties:
+        # renamed or removed columns change every row of the database
+        rows = [
+            key for key, (_, page) in _cache.items()
+            if key[0] == "page" and page.get("parent", {}).get("database_id") == database_id
+        ]
+        for key in rows:
+            del _cache[key]
+        # the title property may have been renamed; title keys are not tracked per database
+        cache_invalidate(kind="title_key")
+    return res
 
 
 # ---------------- BLOCK TOOLS ----------------
@@ -547,14 +912,50 @@ def markdown_to_rich_text(content: str) -> List[Dict[str, Any]]:
     return [{"type": "text", "text": {"content": content}}]
 
 
+async def _append_children(block_id: str, children: List[Dict[str, Any]], after: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Append children to a block, MAX_BLOCKS_PER_APPEND per request.
+    Chunks are sent one after another so the blocks keep their order; when
+    `after` is given each chunk is placed after the last block of the previous
+    one. The results of all chunks are returned as one list. If a chunk fails,
+    the error is returned along with the blocks appended before it.
+    The block's cached metadata (has_children) is dropped once anything was appended.
+    """
+    if len(children) <= MAX_BLOCKS_PER_APPEND:
+        payload = {"children": children}
+        if after is not None:
+            payload["after"] = after
+        res = await safe_execute(notion.blocks.children.append, block_id=block_id, **payload)
+        if res["successful"]:
+            cache_delete(("block", normalize_notion_id(block_id)))
+        return res
+
+    results = []
+    for i in range(0, len(children), MAX_BLOCKS_PER_APPEND):
+        payload = {"children": children[i:i + MAX_BLOCKS_PER_APPEND]}
+        if after is not None:
+            payload["after"] = after
+        res = await safe_execute(notion.blocks.children.append, block_id=block_id, **payload)
+        if not res["successful"]:
+            if results:
+                cache_delete(("block", normalize_notion_id(block_id)))
+            return {"successful": False, "data": {"results": results}, "error": res["error"]}
+        chunk_results = res["data"].get("results", [])
+        results.extend(chunk_results)
+        if after is not None and chunk_results:
+            after = chunk_results[-1]["id"]
+    cache_delete(("block", normalize_notion_id(block_id)))
+    return {"successful": True, "data": {"object": "list", "results": results}, "error": None}
+
+
 @mcp.tool()
-def NOTION_ADD_MULTIPLE_PAGE_CONTENT(parent_block_id: str, content_blocks: List[Dict[str, Any]], after: Optional[str] = None):
+async def NOTION_ADD_MULTIPLE_PAGE_CONTENT(parent_block_id: str, content_blocks: List[Dict[str, Any]], after: Optional[str] = None):
     """
     Add multiple content blocks to a Notion page or block.
     
     Args:
         parent_block_id: ID of the parent block/page to add content to
-        content_blocks: List of block objects or content dictionaries to add
+        content_blocks: List of block objects or content dictionaries to add (sent 100 per request)
         after: Optional block ID to insert content after
     
     Returns:
@@ -564,8 +965,6 @@ def NOTION_ADD_MULTIPLE_PAGE_CONTENT(parent_block_id: str, content_blocks: List[
         return {"successful": False, "data": {}, "error": "Invalid parent_block_id"}
     if not isinstance(content_blocks, list) or len(content_blocks) == 0:
         return {"successful": False, "data": {}, "error": "content_blocks must be a non-empty list"}
-    if len(content_blocks) > 100:
-        return {"successful": False, "data": {}, "error": "Maximum 100 blocks per request"}
 
     parsed_blocks = []
     for block in content_blocks:
@@ -576,14 +975,11 @@ def NOTION_ADD_MULTIPLE_PAGE_CONTENT(parent_block_id: str, content_blocks: List[
         else:
             return {"successful": False, "data": {}, "error": f"Invalid block format: {block}"}
 
-    payload = {"children": parsed_blocks}
-    if after is not None:
-        payload["after"] = after
-    return safe_execute(lambda **kw: notion.blocks.children.append(**kw), block_id=parent_block_id, **payload)
+    return await _append_children(parent_block_id, parsed_blocks, after)
 
 
 @mcp.tool()
-def NOTION_ADD_PAGE_CONTENT(parent_block_id: str, content_block: Dict[str, Any], after: Optional[str] = None):
+async def NOTION_ADD_PAGE_CONTENT(parent_block_id: str, content_block: Dict[str, Any], after: Optional[str] = None):
     """
     Add a single content block to a Notion page or block.
     
@@ -602,17 +998,20 @@ def NOTION_ADD_PAGE_CONTENT(parent_block_id: str, content_block: Dict[str, Any],
     payload = {"children": [content_block]}
     if after is not None:
         payload["after"] = after
-    return safe_execute(lambda **kw: notion.blocks.children.append(**kw), block_id=parent_block_id, **payload)
+    res = await safe_execute(notion.blocks.children.append, block_id=parent_block_id, **payload)
+    if res["successful"]:
+        cache_delete(("block", normalize_notion_id(parent_block_id)))
+    return res
 
 
 @mcp.tool()
-def NOTION_APPEND_BLOCK_CHILDREN(block_id: str, children: List[Dict[str, Any]], after: Optional[str] = None):
+async def NOTION_APPEND_BLOCK_CHILDREN(block_id: str, children: List[Dict[str, Any]], after: Optional[str] = None):
     """
     Append child blocks to a Notion block or page.
     
     Args:
         block_id: ID of the parent block to append children to
-        children: List of block objects to append
+        children: List of block objects to append (sent 100 per request)
         after: Optional block ID to insert children after
     
     Returns:
@@ -622,16 +1021,11 @@ def NOTION_APPEND_BLOCK_CHILDREN(block_id: str, children: List[Dict[str, Any]],
         return {"successful": False, "data": {}, "error": "Invalid block_id"}
     if not isinstance(children, list) or len(children) == 0:
         return {"successful": False, "data": {}, "error": "children must be a non-empty list"}
-    if len(children) > 100:
-        return {"successful": False, "data": {}, "error": "Maximum 100 blocks per request"}
-    payload = {"children": children}
-    if after is not None:
-        payload["after"] = after
-    return safe_execute(lambda **kw: notion.blocks.children.append(**kw), block_id=block_id, **payload)
+    return await _append_children(block_id, children, after)
 
 
 @mcp.tool()
-def NOTION_UPDATE_BLOCK(block_id: str, block_type: str, content: str, additional_properties: Optional[Dict[str, Any]] = None):
+async def NOTION_UPDATE_BLOCK(block_id: str, block_type: str, content: str, additional_properties: Optional[Dict[str, Any]] = None):
     """
     Update the content of an existing Notion block.
     
@@ -646,30 +1040,29 @@ def NOTION_UPDATE_BLOCK(block_id: str, block_type: str, content: str, additional
     """
     if not validate_notion_id(block_id):
         return {"successful": False, "data": {}, "error": "Invalid block_id"}
+    block_id = normalize_notion_id(block_id)
     # For text-like blocks we populate the type's rich_text or text key depending on type.
     # Caller should pass appropriate block_type and additional_properties when needed.
     block_payload = {}
     # Common mapping for text-based blocks
-    if block_type in ("paragraph", "heading_1", "heading_2", "heading_3", "bulleted_list_item", "numbered_list_item", "quote"):
+    if block_type in _TEXT_BLOCK_TYPES:
         # Notion expects e.g. {"paragraph": {"rich_text": [...], **additional_properties}}
         block_payload[block_type] = {"rich_text": markdown_to_rich_text(content)}
         if additional_properties:
             block_payload[block_type].update(additional_properties)
-    elif block_type == "to_do":
-        block_payload["to_do"] = {"rich_text": markdown_to_rich_text(content)}
-        if additional_properties:
-            block_payload["to_do"].update(additional_properties)
     else:
         # For other block types, allow caller to provide the payload via additional_properties
         if not additional_properties:
             return {"successful": False, "data": {}, "error": f"Unsupported block_type '{block_type}' without additional_properties"}
         block_payload[block_type] = additional_properties
 
-    return safe_execute(lambda **kw: notion.blocks.update(**kw), block_id=block_id, **block_payload)
+    res = await safe_execute(notion.blocks.update, block_id=block_id, **block_payload)
+    cache_delete(("block", block_id))
+    return res
 
 
 @mcp.tool()
-def NOTION_DELETE_BLOCK(block_id: str):
+async def NOTION_DELETE_BLOCK(block_id: str):
     """
     Delete (archive) a Notion block.
     
@@ -681,11 +1074,17 @@ def NOTION_DELETE_BLOCK(block_id: str):
     """
     if not validate_notion_id(block_id):
         return {"successful": False, "data": {}, "error": "Invalid block_id"}
-    return safe_execute(lambda **kw: notion.blocks.update(**kw), block_id=block_id, archived=True)
+    block_id = normalize_notion_id(block_id)
+    res = await safe_execute(notion.blocks.update, block_id=block_id, archived=True)
+    # the block may be a page, which must drop out of cached page lookups and searches
+    cache_delete(("page", block_id))
+    cache_delete(("block", block_id))
+    cache_invalidate(kind="search")
+    return res
 
 
 @mcp.tool()
-def NOTION_FETCH_BLOCK_CONTENTS(block_id: str, page_size: Optional[int] = None, start_cursor: Optional[str] = None):
+async def NOTION_FETCH_BLOCK_CONTENTS(block_id: str, page_size: Optional[int] = None, start_cursor: Optional[str] = None):
     """
     Retrieve the child blocks of a Notion block or page.
     
@@ -704,11 +1103,11 @@ def NOTION_FETCH_BLOCK_CONTENTS(block_id: str, page_size: Optional[int] = None,
         kwargs["page_size"] = page_size
     if start_cursor:
         kwargs["start_cursor"] = start_cursor
-    return safe_execute(lambda **kw: notion.blocks.children.list(**kw), **kwargs)
+    return await safe_execute(notion.blocks.children.list, **kwargs)
 
 
 @mcp.tool()
-def NOTION_FETCH_BLOCK_METADATA(block_id: str):
+async def NOTION_FETCH_BLOCK_METADATA(block_id: str):
     """
     Retrieve metadata information for a Notion block.
     
@@ -720,11 +1119,12 @@ def NOTION_FETCH_BLOCK_METADATA(block_id: str):
     """
     if not validate_notion_id(block_id):
         return {"successful": False, "data": {}, "error": "Invalid block_id"}
-    return safe_execute(lambda **kw: notion.blocks.retrieve(**kw), block_id=block_id)
+    block_id = normalize_notion_id(block_id)
+    return await cached_execute(("block", block_id), notion.blocks.retrieve, block_id=block_id)
 
 
 @mcp.tool()
-def mcp_notion_get_all_ids_from_name(name: str, max_depth: int = 3):
+async def mcp_notion_get_all_ids_from_name(name: str, max_depth: int = 3):
     """
     Search for Notion items by name and retrieve their IDs and related information.
     
@@ -737,7 +1137,7 @@ def mcp_notion_get_all_ids_from_name(name: str, max_depth: int = 3):
     """
     if not name or not isinstance(name, str):
         return {"successful": False, "data": {}, "error": "name is required"}
-    res = safe_execute(lambda **kw: notion.search(**kw), query=name)
+    res = await safe_execute(notion.search, query=name)
     if not res["successful"]:
         return res
     results = res["data"].get("results", [])
@@ -749,35 +1149,59 @@ def mcp_notion_get_all_ids_from_name(name: str, max_depth: int = 3):
     result: Dict[str, Any] = {"object_type": obj_type, "id": obj_id, "parent": target.get("parent", {}), "blocks": [], "rows": [], "comments": []}
     # extract title
     if obj_type == "page":
-        try:
-            for k, v in target.get("properties", {}).items():
-                if isinstance(v, dict) and "title" in v:
-                    result["title"] = "".join([t.get("plain_text", "") for t in v.get("title", [])]) or "Untitled"
-                    break
-        except Exception:
-            result["title"] = "Untitled"
+        result["title"] = _extract_title(target.get("properties", {})) or "Untitled"
     elif obj_type == "database":
         title = target.get("title", [])
         result["title"] = title[0].get("plain_text", "Untitled") if title else "Untitled"
     # blocks & comments
     if obj_type == "page":
-        blocks_col = _collect_all_blocks(obj_id)
-        if blocks_col["successful"]:
-            result["blocks"] = [{"id": b.get("id"), "type": b.get("type"), "has_children": b.get("has_children", False)} for b in blocks_col["data"].get("results", [])]
-        comments_res = safe_execute(lambda **kw: notion.comments.list(**kw), block_id=obj_id)
+        # blocks and comments are independent, fetch them concurrently
+        blocks, comments_res = await asyncio.gather(
+            _project_all_pages(
+                notion.blocks.children.list,
+                lambda b: {"id": b.get("id"), "type": b.get("type"), "has_children": b.get("has_children", False)},
+                block_id=obj_id, page_size=100,
+            ),
+            safe_execute(notion.comments.list, block_id=obj_id),
+        )
+        if blocks is not None:
+            result["blocks"] = blocks
         if comments_res["successful"]:
             for c in comments_res["data"].get("results", []):
-                result["comments"].append({"id": c.get("id"), "discussion_id": c.get("discussion_id"), "text": "".join([t.get("plain_text", "") for t in c.get("rich_text", [])])})
+                result["comments"].append({"id": c.get("id"), "discussion_id": c.get("discussion_id"), "text": _plain_text(c.get("rich_text", []))})
     elif obj_type == "database":
-        rows_res = _collect_all_pages_query(obj_id)
-        if rows_res["successful"]:
-            result["rows"] = [{"id": r.get("id"), "parent": r.get("parent", {})} for r in rows_res["data"].get("results", [])]
+        # only id and parent are kept, so ask Notion to leave out every
+        # property value except the title
+        rows = await _project_all_pages(
+            notion.databases.query,
+            lambda r: {"id": r.get("id"), "parent": r.get("parent", {})},
+            database_id=obj_id, page_size=100, filter_properties=["title"],
+        )
+        if rows is not None:
+            result["rows"] = rows
     return {"successful": True, "data": result, "error": ""}
 
 
 # ---------------- COMMENT TOOLS ----------------
+async def _comment_index(block_id: str) -> Dict[str, Any]:
+    """
+    Fetch every comment on a block, across all pages, indexed by comment id.
+    Returns a safe_execute-style result whose data is {comment_id: comment};
+    successful indexes are cached for NOTION_READ_CACHE_TTL seconds.
+    """
+    index = {}
+    async for res in _iter_result_pages(notion.comments.list, block_id=block_id, page_size=100):
+        if not res["successful"]:
+            return res
+        for c in res["data"].get("results", []):
+            index[c["id"]] = c
+    if NOTION_READ_CACHE_TTL > 0:
+        cache_put(("comments", block_id, "index"), index, NOTION_READ_CACHE_TTL)
+    return {"successful": True, "data": index, "error": None}
+
+
 @mcp.tool()
-def NOTION_CREATE_COMMENT(comment: Dict[str, Any], discussion_id: Optional[str] = None, parent_page_id: Optional[str] = None):
+async def NOTION_CREATE_COMMENT(comment: Dict[str, Any], discussion_id: Optional[str] = None, parent_page_id: Optional[str] = None):
     """
     Create a comment on a Notion page or discussion.
     
@@ -791,6 +1215,8 @@ def NOTION_CREATE_COMMENT(comment: Dict[str, Any], discussion_id: Optional[str]
     """
     if not discussion_id and not parent_page_id:
         return {"successful": False, "data": {}, "error": "Either discussion_id or parent_page_id must be provided."}
+    if parent_page_id:
+        parent_page_id = normalize_notion_id(parent_page_id)
     # Build rich_text payload for comment.create
     payload = {"rich_text": [{"type": "text", "text": {"content": comment.get("content", "")}}]}
     if discussion_id:
@@ -798,11 +1224,14 @@ def NOTION_CREATE_COMMENT(comment: Dict[str, Any], discussion_id: Optional[str]
     else:
         # parent page
         payload["parent"] = {"type": "page_id", "page_id": parent_page_id}
-    return safe_execute(lambda **kw: notion.comments.create(**kw), **payload)
+    res = await safe_execute(notion.comments.create, **payload)
+    # a discussion can belong to any block, so drop every cached comment listing
+    cache_invalidate(None if discussion_id else parent_page_id, kind="comments")
+    return res
 
 
 @mcp.tool()
-def NOTION_GET_COMMENT_BY_ID(parent_block_id: str, comment_id: str):
+async def NOTION_GET_COMMENT_BY_ID(parent_block_id: str, comment_id: str):
     """
     Retrieve a specific comment by its ID from a Notion block.
     
@@ -815,19 +1244,23 @@ def NOTION_GET_COMMENT_BY_ID(parent_block_id: str, comment_id: str):
     """
     if not parent_block_id or not comment_id:
         return {"successful": False, "data": {}, "error": "parent_block_id and comment_id are required."}
-    # fetch (paginated if needed)
-    kwargs = {"block_id": parent_block_id, "page_size": 100}
-    res = safe_execute(lambda **kw: notion.comments.list(**kw), **kwargs)
-    if not res["successful"]:
-        return res
-    for c in res["data"].get("results", []):
-        if c.get("id") == comment_id:
-            return {"successful": True, "data": c, "error": None}
+    parent_block_id = normalize_notion_id(parent_block_id)
+    comment_id = normalize_notion_id(comment_id)
+    # a cached index may predate the comment, so only trust it for hits
+    index = cache_get(("comments", parent_block_id, "index"))
+    if index is None or comment_id not in index:
+        res = await _comment_index(parent_block_id)
+        if not res["successful"]:
+            return res
+        index = res["data"]
+    comment = index.get(comment_id)
+    if comment is not None:
+        return {"successful": True, "data": comment, "error": None}
     return {"successful": False, "data": {}, "error": f"Comment with ID {comment_id} not found."}
 
 
 @mcp.tool()
-def NOTION_FETCH_COMMENTS(block_id: str, page_size: Optional[int] = 100, start_cursor: Optional[str] = None):
+async def NOTION_FETCH_COMMENTS(block_id: str, page_size: Optional[int] = 100, start_cursor: Optional[str] = None):
     """
     Retrieve all comments for a Notion block.
     
@@ -841,20 +1274,21 @@ def NOTION_FETCH_COMMENTS(block_id: str, page_size: Optional[int] = 100, start_c
     """
     if not block_id:
         return {"successful": False, "data": {}, "error": "block_id is required."}
+    block_id = normalize_notion_id(block_id)
     kwargs = {"block_id": block_id, "page_size": page_size}
     if start_cursor is not None:
         kwargs["start_cursor"] = start_cursor
-    return safe_execute(lambda **kw: notion.comments.list(**kw), **kwargs)
+    return await cached_execute(("comments", block_id, request_key(kwargs)), notion.comments.list, cache_ttl=NOTION_READ_CACHE_TTL, **kwargs)
 #--------------------------------------
            #SEARCH TOOLS
 #--------------------------------------
 
 @mcp.tool()
-def NOTION_SEARCH_NOTION_PAGE(
+async def NOTION_SEARCH_NOTION_PAGE(
     direction: Optional[str] = None,
     filter_property: Optional[str] = "object",
     filter_value: Optional[str] = "page",
-    page_size: int = 2,
+    page_size: int = 100,
     query: Optional[str] = "",
     start_cursor: Optional[str] = None,
     timestamp: Optional[str] = None,
@@ -866,7 +1300,7 @@ def NOTION_SEARCH_NOTION_PAGE(
         direction: Optional sort direction (ascending/descending)
         filter_property: Property to filter by (default: "object")
         filter_value: Value to filter by (default: "page")
-        page_size: Number of results per page (default: 2)
+        page_size: Number of results per page, 1-100 (default: 100)
         query: Search query string (empty returns all accessible items)
         start_cursor: Optional cursor for pagination
         timestamp: Optional timestamp for sorting
@@ -874,9 +1308,10 @@ def NOTION_SEARCH_NOTION_PAGE(
     Returns:
         dict: Search results with pagination information
     """
+    search_filter = _OBJECT_FILTERS.get(filter_value) if filter_property == "object" else None
     kwargs = {
-        "page_size": page_size,
-        "filter": {"property": filter_property, "value": filter_value},
+        "page_size": min(max(page_size, 1), 100),
+        "filter": search_filter or {"property": filter_property, "value": filter_value},
     }
 
     if query:
@@ -886,10 +1321,18 @@ def NOTION_SEARCH_NOTION_PAGE(
     if start_cursor:
         kwargs["start_cursor"] = start_cursor
 
-    return safe_execute(lambda **kw: notion.search(**kw), **kwargs)
+    return await cached_execute(("search", request_key(kwargs)), notion.search, cache_ttl=NOTION_READ_CACHE_TTL, **kwargs)
+
+# search filter for each NOTION_FETCH_DATA mode; None searches everything
+_FETCH_DATA_FILTERS = {
+    "all": None,
+    "databases": _OBJECT_FILTERS["database"],
+    "pages": _OBJECT_FILTERS["page"],
+}
+
 
 @mcp.tool()
-def NOTION_FETCH_DATA(
+async def NOTION_FETCH_DATA(
     get_all: bool = False,
     get_databases: bool = False,
     get_pages: bool = False,
@@ -902,33 +1345,62 @@ def NOTION_FETCH_DATA(
     Args:
         get_all: Whether to fetch all accessible items (default: False)
         get_databases: Whether to fetch only databases (default: False)
-        get_pages: Whether to fetch only pages (default: False)
+        get_pages: Whether to fetch only pages (default: False; pages are also fetched when no flag is set,
+            and setting both get_databases and get_pages fetches all items)
         page_size: Number of items per page (default: 100)
         query: Optional search query string
     
     Returns:
         dict: List of Notion items with minimal metadata
     """
+    if get_all or (get_databases and get_pages):
+        mode = "all"
+    elif get_databases:
+        mode = "databases"
+    else:
+        mode = "pages"
+
     kwargs = {"page_size": page_size}
     if query:
         kwargs["query"] = query
+    if _FETCH_DATA_FILTERS[mode] is not None:
+        kwargs["filter"] = _FETCH_DATA_FILTERS[mode]
+    return await cached_execute(("search", request_key(kwargs)), notion.search, cache_ttl=NOTION_READ_CACHE_TTL, **kwargs)
 
-    if get_all:
-        return safe_execute(lambda **kw: notion.search(**kw), **kwargs)
 
-    if get_databases:
-        kwargs["filter"] = {"property": "object", "value": "database"}
-        return safe_execute(lambda **kw: notion.search(**kw), **kwargs)
-
-    if get_pages:
-        kwargs["filter"] = {"property": "object", "value": "page"}
-        return safe_execute(lambda **kw: notion.search(**kw), **kwargs)
-
-    # Default: pages
-    kwargs["filter"] = {"property": "object", "value": "page"}
-    return safe_execute(lambda **kw: notion.search(**kw), **kwargs)
+# ---------------- CACHE TOOLS ----------------
+@mcp.tool()
+async def NOTION_INVALIDATE_CACHE(object_id: Optional[str] = None):
+    """
+    Drop cached Notion responses so the next fetch goes to the API.
+    
+    Args:
+        object_id: Optional ID of the database, block or page to drop; clears the whole cache (including searches) when omitted
+    
+    Returns:
+        dict: Number of cache entries dropped
+    """
+    if object_id is None:
+        return {"successful": True, "data": {"invalidated": cache_invalidate()}, "error": None}
+    if not validate_notion_id(object_id):
+        return {"successful": False, "data": {}, "error": "Invalid object_id format"}
+    return {"successful": True, "data": {"invalidated": cache_invalidate(normalize_notion_id(object_id))}, "error": None}
 
 # ---------------- ENTRYPOINT ----------------
 if __name__ == "__main__":
+    # FastMCP() already installed a root handler, so force replaces it
+    logging.basicConfig(
+        level=os.getenv("NOTION_LOG_LEVEL", "INFO").upper(),
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        force=True,
+    )
     logger.info("Starting Notion MCP server...")
-    asyncio.run(mcp.run())
+    # uvloop is optional; when installed it replaces the default asyncio loop
+    # that every tool call and Notion request runs on.
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    mcp.run()